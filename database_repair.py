@@ -6,6 +6,7 @@ Fixes database schema issues and adds missing columns/tables
 
 import sqlite3
 import os
+import sys
 import logging
 from datetime import datetime
 
@@ -16,231 +17,267 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def backup_database(db_file):
-    """Create a backup of the database before migration"""
+# Columns that older databases may be missing, added via ALTER TABLE
+REQUIRED_SCHEMA = {
+    'recordings': {
+        'country': 'TEXT',
+        'city': 'TEXT',
+        'file_size': 'INTEGER',
+        'error_message': 'TEXT',
+    },
+    'scheduled_recordings': {
+        'interval_minutes': 'INTEGER',
+        'country': 'TEXT',
+        'city': 'TEXT',
+    },
+    'connection_status': {
+        'country': 'TEXT',
+        'city': 'TEXT',
+        'error_message': 'TEXT',
+    },
+}
+
+# Full definitions used when a table does not exist at all
+CREATE_SQL = {
+    'recordings': '''
+        CREATE TABLE recordings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            station_name TEXT NOT NULL,
+            station_url TEXT NOT NULL,
+            country TEXT,
+            city TEXT,
+            duration INTEGER,
+            file_path TEXT,
+            status TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+            file_size INTEGER,
+            error_message TEXT
+        )
+    ''',
+    'scheduled_recordings': '''
+        CREATE TABLE scheduled_recordings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            station_name TEXT NOT NULL,
+            station_url TEXT NOT NULL,
+            schedule_time TEXT NOT NULL,
+            duration INTEGER NOT NULL,
+            repeat_type TEXT DEFAULT 'interval',
+            interval_minutes INTEGER,
+            country TEXT,
+            city TEXT,
+            is_active BOOLEAN DEFAULT TRUE,
+            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    ''',
+    'connection_status': '''
+        CREATE TABLE connection_status (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            station_name TEXT NOT NULL,
+            station_url TEXT NOT NULL,
+            status TEXT NOT NULL,
+            response_time REAL,
+            country TEXT,
+            city TEXT,
+            last_check DATETIME DEFAULT CURRENT_TIMESTAMP,
+            error_message TEXT
+        )
+    ''',
+}
+
+def backup_database(db_file, stat=None):
+    """Create a backup of the database before migration
+    
+    stat: os.stat result for db_file, when the caller already has one
+    """
     try:
-        if os.path.exists(db_file):
+        if stat is not None or os.path.exists(db_file):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = f"{db_file}.backup_{timestamp}"
             
-            # Copy database file
-            import shutil
-            shutil.copy2(db_file, backup_file)
-            logger.info(f"Database backed up to: {backup_file}")
+            # Copy through the online backup API so WAL contents are included
+            # and concurrent writers are handled under SQLite's own locking
+            src = sqlite3.connect(db_file)
+            dst = sqlite3.connect(backup_file)
+            with dst:
+                src.backup(dst, pages=1000,
+                           progress=lambda status, remaining, total: logger.debug("backup %d/%d", total - remaining, total))
+            dst.close()
+            src.close()
+            logger.info("Database backed up to: %s", backup_file)
             return backup_file
         else:
             logger.info("No existing database found, will create new one")
             return None
     except Exception as e:
-        logger.error(f"Error creating backup: {e}")
+        logger.error("Error creating backup: %s", e)
         return None
 
-def check_table_exists(cursor, table_name):
-    """Check if a table exists in the database"""
-    cursor.execute("""
-        SELECT name FROM sqlite_master 
-        WHERE type='table' AND name=?
-    """, (table_name,))
-    return cursor.fetchone() is not None
+def configure_connection(cursor, db_file):
+    """Switch to WAL journaling so readers are not blocked during migration"""
+    if db_file != ':memory:':
+        cursor.execute("PRAGMA journal_mode=WAL")
+        mode = cursor.fetchone()[0]
+        if mode.lower() != 'wal':
+            logger.warning("Could not enable WAL mode, journal_mode is %s", mode)
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    
+    # Keep pages hot across the migration's DDL statements
+    cursor.execute("PRAGMA cache_size = -65536")  # 64 MiB (negative = KiB)
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    # A 256 MiB mapping does not fit comfortably in a 32-bit Windows address space
+    if not (os.name == 'nt' and sys.maxsize <= 2**32):
+        cursor.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+
+def quote_identifier(name):
+    """Quote a table name after checking it is a plain identifier"""
+    if not name.replace('_', '').isalnum():
+        raise ValueError(f"Invalid identifier: {name}")
+    return f'"{name}"'
 
 def get_table_columns(cursor, table_name):
-    """Get list of columns for a table"""
+    """Get set of column names for a table"""
     try:
-        cursor.execute(f"PRAGMA table_info({table_name})")
-        return [column[1] for column in cursor.fetchall()]
+        cursor.execute("SELECT name FROM pragma_table_info(?)", (table_name,))
+        return {row[0] for row in cursor.fetchall()}
     except:
-        return []
+        return set()
 
-def repair_database(db_file='radio_recordings.db'):
+def _snapshot_schema(cursor):
+    """Read all tables and their columns once, as {table: frozenset(columns)}"""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+    tables = [row[0] for row in cursor.fetchall()]
+    return {table: frozenset(get_table_columns(cursor, table)) for table in tables}
+
+def repair_database(db_file='radio_recordings.db', stat=None):
     """Repair and migrate the database schema"""
     try:
         logger.info("Starting database repair and migration...")
         
         # Create backup
-        backup_file = backup_database(db_file)
+        backup_file = backup_database(db_file, stat=stat)
         
-        # Connect to database
-        conn = sqlite3.connect(db_file)
+        # Connect to database; isolation_level=None turns off the sqlite3
+        # module's implicit transactions so the explicit BEGIN below is the
+        # only transaction boundary around the DDL
+        conn = sqlite3.connect(db_file, isolation_level=None)
         cursor = conn.cursor()
+        configure_connection(cursor, db_file)
+        
+        schema = _snapshot_schema(cursor)
+        statements = []
         
         # 1. Create missing tables
         logger.info("Checking and creating missing tables...")
         
-        # Create recordings table
-        if not check_table_exists(cursor, 'recordings'):
-            logger.info("Creating recordings table...")
-            cursor.execute('''
-                CREATE TABLE recordings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    station_name TEXT NOT NULL,
-                    station_url TEXT NOT NULL,
-                    country TEXT,
-                    city TEXT,
-                    duration INTEGER,
-                    file_path TEXT,
-                    status TEXT,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    file_size INTEGER,
-                    error_message TEXT
-                )
-            ''')
-        
-        # Create scheduled_recordings table
-        if not check_table_exists(cursor, 'scheduled_recordings'):
-            logger.info("Creating scheduled_recordings table...")
-            cursor.execute('''
-                CREATE TABLE scheduled_recordings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    station_name TEXT NOT NULL,
-                    station_url TEXT NOT NULL,
-                    schedule_time TEXT NOT NULL,
-                    duration INTEGER NOT NULL,
-                    repeat_type TEXT DEFAULT 'interval',
-                    interval_minutes INTEGER,
-                    country TEXT,
-                    city TEXT,
-                    is_active BOOLEAN DEFAULT TRUE,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-        
-        # Create connection_status table
-        if not check_table_exists(cursor, 'connection_status'):
-            logger.info("Creating connection_status table...")
-            cursor.execute('''
-                CREATE TABLE connection_status (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    station_name TEXT NOT NULL,
-                    station_url TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    response_time REAL,
-                    country TEXT,
-                    city TEXT,
-                    last_check DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    error_message TEXT
-                )
-            ''')
+        for table in REQUIRED_SCHEMA:
+            if table not in schema:
+                logger.info("Creating %s table...", table)
+                statements.append(CREATE_SQL[table])
         
         # 2. Add missing columns to existing tables
         logger.info("Checking and adding missing columns...")
         
-        # Migrate recordings table
-        if check_table_exists(cursor, 'recordings'):
-            recordings_columns = get_table_columns(cursor, 'recordings')
-            
-            if 'country' not in recordings_columns:
-                cursor.execute('ALTER TABLE recordings ADD COLUMN country TEXT')
-                logger.info("Added country column to recordings table")
+        # Tables created above already have every column, so only the
+        # tables present in the original snapshot need checking
+        added_columns = []
+        for table, columns in REQUIRED_SCHEMA.items():
+            if table not in schema:
+                continue
             
-            if 'city' not in recordings_columns:
-                cursor.execute('ALTER TABLE recordings ADD COLUMN city TEXT')
-                logger.info("Added city column to recordings table")
-            
-            if 'file_size' not in recordings_columns:
-                cursor.execute('ALTER TABLE recordings ADD COLUMN file_size INTEGER')
-                logger.info("Added file_size column to recordings table")
-            
-            if 'error_message' not in recordings_columns:
-                cursor.execute('ALTER TABLE recordings ADD COLUMN error_message TEXT')
-                logger.info("Added error_message column to recordings table")
-        
-        # Migrate scheduled_recordings table
-        if check_table_exists(cursor, 'scheduled_recordings'):
-            scheduled_columns = get_table_columns(cursor, 'scheduled_recordings')
-            
-            if 'interval_minutes' not in scheduled_columns:
-                cursor.execute('ALTER TABLE scheduled_recordings ADD COLUMN interval_minutes INTEGER')
-                logger.info("Added interval_minutes column to scheduled_recordings table")
-            
-            if 'country' not in scheduled_columns:
-                cursor.execute('ALTER TABLE scheduled_recordings ADD COLUMN country TEXT')
-                logger.info("Added country column to scheduled_recordings table")
-            
-            if 'city' not in scheduled_columns:
-                cursor.execute('ALTER TABLE scheduled_recordings ADD COLUMN city TEXT')
-                logger.info("Added city column to scheduled_recordings table")
-        
-        # Migrate connection_status table
-        if check_table_exists(cursor, 'connection_status'):
-            connection_columns = get_table_columns(cursor, 'connection_status')
-            
-            if 'country' not in connection_columns:
-                cursor.execute('ALTER TABLE connection_status ADD COLUMN country TEXT')
-                logger.info("Added country column to connection_status table")
-            
-            if 'city' not in connection_columns:
-                cursor.execute('ALTER TABLE connection_status ADD COLUMN city TEXT')
-                logger.info("Added city column to connection_status table")
-            
-            if 'error_message' not in connection_columns:
-                cursor.execute('ALTER TABLE connection_status ADD COLUMN error_message TEXT')
-                logger.info("Added error_message column to connection_status table")
+            for column, column_type in columns.items():
+                if column not in schema[table]:
+                    statements.append(f'ALTER TABLE {table} ADD COLUMN {column} {column_type}')
+                    schema[table] |= {column}
+                    added_columns.append((column, table))
         
         # 3. Create indexes for better performance
         logger.info("Creating database indexes...")
         
+        statements.extend([
+            'CREATE INDEX IF NOT EXISTS idx_recordings_timestamp ON recordings(timestamp)',
+            'CREATE INDEX IF NOT EXISTS idx_recordings_status ON recordings(status)',
+            'CREATE INDEX IF NOT EXISTS idx_recordings_country ON recordings(country)',
+            'CREATE INDEX IF NOT EXISTS idx_connection_status_name ON connection_status(station_name)',
+            'CREATE INDEX IF NOT EXISTS idx_connection_status_last_check ON connection_status(last_check)',
+            # Dashboard filters on country+status and pages by country newest-first
+            'CREATE INDEX IF NOT EXISTS idx_recordings_country_status ON recordings(country, status)',
+            'CREATE INDEX IF NOT EXISTS idx_recordings_country_timestamp ON recordings(country, timestamp DESC)',
+            # Active schedule listing and cancel-by-station lookups in the dashboard
+            'CREATE INDEX IF NOT EXISTS idx_scheduled_active_time ON scheduled_recordings(is_active, schedule_time)',
+            'CREATE INDEX IF NOT EXISTS idx_scheduled_station_time ON scheduled_recordings(station_name, schedule_time)',
+            # Populate sqlite_stat1 so the planner can pick between the indexes
+            'ANALYZE',
+        ])
+        
+        # Apply all DDL as one transaction; BEGIN/COMMIT live inside the
+        # script because executescript() commits any pending transaction first
         try:
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_recordings_timestamp ON recordings(timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_recordings_status ON recordings(status)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_recordings_country ON recordings(country)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_connection_status_name ON connection_status(station_name)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_connection_status_last_check ON connection_status(last_check)')
-            logger.info("Database indexes created successfully")
-        except Exception as e:
-            logger.warning(f"Some indexes may already exist: {e}")
-        
-        # Commit all changes
-        conn.commit()
-        conn.close()
+            cursor.executescript("BEGIN IMMEDIATE;\n" + ";\n".join(statements) + ";\nCOMMIT;")
+        except Exception:
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            conn.close()
+            raise
+        for column, table in added_columns:
+            logger.info("Added %s column to %s table", column, table)
+        logger.info("Database indexes created successfully")
         
         logger.info("✅ Database repair and migration completed successfully!")
         
-        # Verify the repair
-        verify_database_repair(db_file)
+        # Verify the repair on the same connection
+        verify_database_repair(db_file, conn=conn)
+        conn.close()
         
         return True
         
     except Exception as e:
-        logger.error(f"❌ Error during database repair: {e}")
+        logger.error("❌ Error during database repair: %s", e)
         return False
 
-def verify_database_repair(db_file='radio_recordings.db'):
-    """Verify that the database repair was successful"""
+def verify_database_repair(db_file='radio_recordings.db', conn=None):
+    """Verify that the database repair was successful, reusing conn if given"""
+    owns_conn = conn is None
     try:
-        conn = sqlite3.connect(db_file)
+        if owns_conn:
+            conn = sqlite3.connect(db_file)
         cursor = conn.cursor()
         
-        # Check tables exist
-        required_tables = ['recordings', 'scheduled_recordings', 'connection_status']
-        existing_tables = []
+        schema = _snapshot_schema(cursor)
         
-        for table in required_tables:
-            if check_table_exists(cursor, table):
-                existing_tables.append(table)
+        # Check tables exist
+        existing_tables = [table for table in REQUIRED_SCHEMA if table in schema]
         
-        logger.info(f"✅ Tables found: {existing_tables}")
+        logger.info("✅ Tables found: %s", existing_tables)
         
         # Check key columns exist
-        connection_columns = get_table_columns(cursor, 'connection_status')
-        required_columns = ['country', 'city', 'error_message']
+        connection_columns = schema.get('connection_status', frozenset())
+        required_columns = list(REQUIRED_SCHEMA['connection_status'])
         
         missing_columns = [col for col in required_columns if col not in connection_columns]
         
         if missing_columns:
-            logger.warning(f"⚠️ Missing columns in connection_status: {missing_columns}")
+            logger.warning("⚠️ Missing columns in connection_status: %s", missing_columns)
         else:
             logger.info("✅ All required columns present in connection_status table")
         
         # Get record counts
         for table in existing_tables:
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            cursor.execute(f"SELECT COUNT(*) FROM {quote_identifier(table)}")
             count = cursor.fetchone()[0]
-            logger.info(f"📊 {table}: {count} records")
+            logger.info("📊 %s: %s records", table, count)
         
-        conn.close()
+        if logger.isEnabledFor(logging.DEBUG) and 'recordings' in schema:
+            cursor.execute("EXPLAIN QUERY PLAN SELECT id FROM recordings WHERE country = ? AND status = ?",
+                           ('', ''))
+            logger.debug("Country/status query plan: %s", [row[-1] for row in cursor.fetchall()])
+        
+        cursor.execute("PRAGMA optimize")
+        if owns_conn:
+            conn.close()
         
     except Exception as e:
-        logger.error(f"Error during verification: {e}")
+        logger.error("Error during verification: %s", e)
 
 def clean_old_data(db_file='radio_recordings.db', days_to_keep=30):
     """Optional: Clean old data from the database"""
@@ -249,20 +286,28 @@ def clean_old_data(db_file='radio_recordings.db', days_to_keep=30):
         cursor = conn.cursor()
         
         # Clean old connection status records (keep last 30 days)
-        cursor.execute("""
-            DELETE FROM connection_status 
-            WHERE last_check < datetime('now', '-{} days')
-        """.format(days_to_keep))
+        delete_sql = "DELETE FROM connection_status WHERE last_check < datetime('now', ?)"
+        params = (f'-{int(days_to_keep)} days',)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            cursor.execute(f"EXPLAIN QUERY PLAN {delete_sql}", params)
+            logger.debug("Cleanup query plan: %s", [row[-1] for row in cursor.fetchall()])
+        
+        cursor.execute(delete_sql, params)
         
         deleted_count = cursor.rowcount
         if deleted_count > 0:
-            logger.info(f"🧹 Cleaned {deleted_count} old connection status records")
+            logger.info("🧹 Cleaned %s old connection status records", deleted_count)
         
         conn.commit()
+        
+        # Reclaim the WAL space used by the delete
+        cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        cursor.execute("PRAGMA optimize")
         conn.close()
         
     except Exception as e:
-        logger.error(f"Error cleaning old data: {e}")
+        logger.error("Error cleaning old data: %s", e)
 
 def main():
     """Main function to run database repair"""
@@ -272,9 +317,14 @@ def main():
     db_file = 'radio_recordings.db'
     
     # Check if database exists
-    if os.path.exists(db_file):
+    try:
+        st = os.stat(db_file)
+    except FileNotFoundError:
+        st = None
+    
+    if st:
         print(f"📁 Found existing database: {db_file}")
-        print(f"📊 Size: {os.path.getsize(db_file)} bytes")
+        print(f"📊 Size: {st.st_size} bytes")
     else:
         print(f"📁 No existing database found, will create: {db_file}")
     
@@ -282,7 +332,7 @@ def main():
     response = input("\n🔄 Proceed with database repair/migration? (y/N): ").strip().lower()
     
     if response in ['y', 'yes']:
-        success = repair_database(db_file)
+        success = repair_database(db_file, stat=st)
         
         if success:
             print("\n✅ Database repair completed successfully!")
@@ -4,15 +4,20 @@ Gradio Web App for Arabic Radio Station Scraping and Recording
 A user-friendly interface for browsing and recording Arabic radio stations.
 """
 
-import gradio as gr
 import json
 import os
+import re
 import subprocess
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +29,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Countries offered in the UI (only those present in the data file are shown)
+ARABIC_COUNTRIES = [
+    'Algeria', 'Bahrain', 'Jordan', 'Kuwait', 'Lebanon', 'Egypt', 'Iraq',
+    'Libya', 'Morocco', 'Oman', 'Palestine', 'Saudi Arabia', 'Somalia',
+    'Sudan', 'United Arab Emirates', 'Tunisia', 'Syria', 'Yemen', 'Qatar'
+]
+
+# Anything other than letters, digits, space, '-' and '_' is dropped from filenames
+_INVALID_FILENAME_CHARS = re.compile(r'[^\w \-]')
+
 class GradioRadioApp:
     """Gradio web application for Arabic radio station management"""
     
@@ -31,13 +46,16 @@ class GradioRadioApp:
         self.data_file = data_file
         self.stations_by_country = {}
         self.stations_by_city = {}
+        self._arabic_countries_cached = []
+        self._cities_by_country_cached = {}
         self.load_stations()
     
     def load_stations(self):
         """Load radio stations from JSON file"""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
             self.stations_by_country = data.get('stations_by_country', {})
             self.stations_by_city = data.get('stations_by_city', {})
@@ -52,22 +70,25 @@ class GradioRadioApp:
             logger.error(f"Error loading stations: {e}")
             self.stations_by_country = {}
             self.stations_by_city = {}
+        
+        self._build_location_caches()
+    
+    def _build_location_caches(self):
+        """Precompute dropdown choices; station data does not change within a session"""
+        self._arabic_countries_cached = sorted(set(ARABIC_COUNTRIES) & self.stations_by_country.keys())
+        self._cities_by_country_cached = {}
+        for country, stations in self.stations_by_country.items():
+            try:
+                self._cities_by_country_cached[country] = sorted(
+                    {s['state'].strip() for s in stations if s.get('state') and s['state'].strip()}
+                )
+            except Exception as e:
+                logger.error(f"Error getting cities for {country}: {e}")
+                self._cities_by_country_cached[country] = []
     
     def get_countries(self) -> List[str]:
         """Get list of available Arabic countries only"""
-        arabic_countries = [
-            'Algeria', 'Bahrain', 'Jordan', 'Kuwait', 'Lebanon', 'Egypt', 'Iraq',
-            'Libya', 'Morocco', 'Oman', 'Palestine', 'Saudi Arabia', 'Somalia',
-            'Sudan', 'United Arab Emirates', 'Tunisia', 'Syria', 'Yemen', 'Qatar'
-        ]
-        
-        # Filter to only include countries that have data
-        available_countries = []
-        for country in arabic_countries:
-            if country in self.stations_by_country:
-                available_countries.append(country)
-        
-        return sorted(available_countries)
+        return self._arabic_countries_cached
     
     def get_cities_by_country(self, country: str) -> List[str]:
         """Get cities for a specific country"""
@@ -75,18 +96,7 @@ class GradioRadioApp:
             if not country or not country.strip():
                 return []
             
-            cities = set()
-            stations = self.stations_by_country.get(country, [])
-            
-            for station in stations:
-                try:
-                    if station.get('state') and station['state'].strip():
-                        cities.add(station['state'].strip())
-                except Exception as e:
-                    logger.debug(f"Error processing station state: {e}")
-                    continue
-            
-            return sorted(list(cities))
+            return self._cities_by_country_cached.get(country, [])
             
         except Exception as e:
             logger.error(f"Error getting cities for {country}: {e}")
@@ -133,8 +143,30 @@ class GradioRadioApp:
             logger.error(f"Error in get_stations_display: {e}")
             return f"Error loading stations: {str(e)}"
     
-    def record_stations(self, country: str, city: str, duration: int, count: int) -> str:
-        """Record multiple radio streams"""
+    def _record_one(self, station: Dict, duration: int) -> str:
+        """Record a single stream and return its result line"""
+        print(f"Recording: {station['name']}")
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_name = _INVALID_FILENAME_CHARS.sub('', station['name']).rstrip()
+        filename = f"{safe_name}_{timestamp}.mp3"
+        filepath = os.path.join("recordings", filename)
+        
+        cmd = ['ffmpeg', '-i', station['url'], '-t', str(duration), 
+               '-c:a', 'mp3', '-b:a', '128k', '-y', filepath]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration+30)
+        except subprocess.TimeoutExpired:
+            return f"❌ {station['name']}: Failed - Recording timeout"
+        
+        if result.returncode == 0:
+            return f"✅ {station['name']}: {filename}"
+        return f"❌ {station['name']}: Failed - {result.stderr[:100]}"
+    
+    def record_stations(self, country: str, city: str, duration: int, count: int,
+                        max_workers: int = 8) -> str:
+        """Record multiple radio streams concurrently (at most max_workers at once)"""
         try:
             if city and city.strip():  # Check if city is not empty
                 stations = self.stations_by_city.get(city, [])
@@ -148,30 +180,20 @@ class GradioRadioApp:
             if not stations:
                 return f"No stations found for {location}"
             
-            stations = stations[:count]
+            stations = stations[:int(count)]
             os.makedirs("recordings", exist_ok=True)
             
-            results = []
-            for i, station in enumerate(stations):
-                print(f"Recording {i+1}/{len(stations)}: {station['name']}")
-                
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_name = "".join(c for c in station['name'] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                filename = f"{safe_name}_{timestamp}.mp3"
-                filepath = os.path.join("recordings", filename)
-                
-                cmd = ['ffmpeg', '-i', station['url'], '-t', str(duration), 
-                       '-c:a', 'mp3', '-b:a', '128k', '-y', filepath]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration+30)
-                
-                if result.returncode == 0:
-                    results.append(f"✅ {station['name']}: {filename}")
-                else:
-                    results.append(f"❌ {station['name']}: Failed - {result.stderr[:100]}")
-                
-                if i < len(stations) - 1:
-                    time.sleep(2)
+            # Each ffmpeg process is network/disk bound, so record them side by side
+            results = [None] * len(stations)
+            with ThreadPoolExecutor(max_workers=max(1, min(len(stations), max_workers))) as executor:
+                futures = {executor.submit(self._record_one, station, duration): i
+                           for i, station in enumerate(stations)}
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        results[i] = f"❌ {stations[i]['name']}: Failed - {str(e)[:100]}"
             
             return f"Recording completed!\n\n" + "\n".join(results)
             
@@ -180,6 +202,8 @@ class GradioRadioApp:
     
     def create_interface(self):
         """Create the Gradio interface"""
+        # Imported here so the class can be used without paying gradio's import cost
+        import gradio as gr
         
         with gr.Blocks(title="Arabic Radio Recorder", theme=gr.themes.Soft()) as app:
             gr.Markdown("# 🎵 Arabic Radio Station Recorder")
@@ -190,11 +214,12 @@ class GradioRadioApp:
                     gr.Markdown("## 📍 Location Selection")
                     
                     # Get initial country for default value
-                    initial_country = self.get_countries()[0] if self.get_countries() else ""
+                    countries = self.get_countries()
+                    initial_country = countries[0] if countries else ""
                     initial_stations = self.get_stations_display(initial_country, "") if initial_country else "Please select a country"
                     
                     country_dropdown = gr.Dropdown(
-                        choices=self.get_countries(),
+                        choices=countries,
                         label="Select Country",
                         value=initial_country,
                         interactive=True
@@ -8,20 +8,45 @@ Features:
 """
 
 import gradio as gr
+import functools
+import heapq
 import json
 import os
+import re
 import subprocess
 import time
 import threading
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional
 import logging
 import requests
-from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+import asyncio
+import httpx
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import schedule
 import signal
 import sys
+import atexit
+import queue
+import importlib.util
+from collections import defaultdict
+from itertools import chain, islice
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib parser
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:  # optional: CSV export falls back to csv.writer
+    pd = None
+# The pandas export needs read_sql_query(dtype=...), added in pandas 2.0
+if pd is not None and int(pd.__version__.split('.')[0]) < 2:
+    pd = None
 
 # Set up logging
 logging.basicConfig(
@@ -33,18 +58,188 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO, which would flood the log during station probes
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Rows written per transaction when persisting connection test results
+CONNECTION_STATUS_BATCH_SIZE = 500
+
+# Applied to every dashboard connection; journal_mode=WAL also persists in the file
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA mmap_size=268435456;"
+    "PRAGMA cache_size=-65536;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA busy_timeout=5000;"
+)
+
+# Hot-path statements, shared so every call hits the per-connection statement cache
+INSERT_RECORDING_SQL = '''
+    INSERT INTO recordings 
+    (station_name, station_url, country, city, duration, file_path, 
+     status, file_size, error_message)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+INSERT_CONNECTION_CHECK_SQL = '''
+    INSERT INTO connection_status 
+    (station_name, station_url, status, response_time, country, city, last_check)
+    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+'''
+UPSERT_CONNECTION_STATUS_SQL = '''
+    INSERT OR REPLACE INTO connection_status 
+    (station_name, station_url, status, last_check)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+'''
+
+# Concurrent probes per streaming host; many stations share a CDN, so capping
+# this makes same-host probes reuse pooled connections instead of opening new ones
+PROBE_MAX_PER_HOST = 8
+# HTTP/2 lets same-host probes multiplex over one connection (needs the h2 package)
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Threads in the app-wide pool shared by every batch recording request
+BATCH_MAX_WORKERS = 16
+
+# Seconds a get_all_stations_status() snapshot may be reused while the background
+# monitor keeps updating individual stations
+STATUS_SNAPSHOT_TTL = 30
+
+# Seconds a rendered get_detailed_statistics() report may be reused
+DETAILED_STATS_TTL = 10
+# Seconds the recent-recordings and storage reports may be reused
+REPORT_CACHE_TTL = 5
+
+# Recordings export: query, CSV header and rows per pandas chunk
+EXPORT_RECORDINGS_SQL = '''
+    SELECT station_name, station_url, country, city, duration, 
+           status, timestamp, file_size, error_message
+    FROM recordings 
+    ORDER BY timestamp DESC
+'''
+EXPORT_HEADER = ['Station Name', 'Station URL', 'Country', 'City', 
+                 'Duration', 'Status', 'Timestamp', 'File Size', 'Error Message']
+EXPORT_CHUNK_ROWS = 10000
+
+# Stations offered in a location's station dropdown
+STATION_DROPDOWN_LIMIT = 20
+
+# Characters stripped from station names when building recording filenames
+_INVALID_FILENAME_CHARS = re.compile(r'[^\w \-]')
+
+_STATUS_ICONS = {'online': '🟢', 'offline': '🔴', 'untested': '⚪'}
+
+# ISO 3166 codes for the country names used in the station data; the flag emoji
+# is the code spelled in regional indicator symbols
+_COUNTRY_CODES = {
+    'Afghanistan': 'AF', 'Algeria': 'DZ', 'American Samoa': 'AS', 'Andorra': 'AD',
+    'Australia': 'AU', 'Bahrain': 'BH', 'Bangladesh': 'BD', 'Cambodia': 'KH',
+    'Canada': 'CA', 'Cuba': 'CU', 'Egypt': 'EG', 'Ethiopia': 'ET', 'France': 'FR',
+    'Germany': 'DE', 'Indonesia': 'ID', 'Iraq': 'IQ', 'Islamic Republic Of Iran': 'IR',
+    'Israel': 'IL', 'Jordan': 'JO', 'Kazakhstan': 'KZ', 'Kuwait': 'KW',
+    'Kyrgyzstan': 'KG', 'Lebanon': 'LB', 'Liberia': 'LR', 'Libya': 'LY',
+    'Mauritania': 'MR', 'Morocco': 'MA', 'Myanmar': 'MM', 'Oman': 'OM',
+    'Pakistan': 'PK', 'Qatar': 'QA', 'Saudi Arabia': 'SA', 'Senegal': 'SN',
+    'Somalia': 'SO', 'South Sudan': 'SS', 'State Of Palestine': 'PS',
+    'Syrian Arab Republic': 'SY', 'Tajikistan': 'TJ', 'The Congo': 'CG',
+    'The Gambia': 'GM', 'The Russian Federation': 'RU', 'The Sudan': 'SD',
+    'The United Arab Emirates': 'AE',
+    'The United Kingdom Of Great Britain And Northern Ireland': 'GB',
+    'The United States Of America': 'US', 'Tonga': 'TO', 'Tunisia': 'TN',
+    'Turkmenistan': 'TM', 'Uzbekistan': 'UZ', 'Yemen': 'YE',
+}
+_COUNTRY_FLAGS = {
+    country: ''.join(chr(0x1F1E6 + ord(letter) - ord('A')) for letter in code)
+    for country, code in _COUNTRY_CODES.items()
+}
+
+@functools.lru_cache(maxsize=4096)
+def _format_station_status(name, city, bitrate, language, status, last_check,
+                           compact=False) -> str:
+    """Render one station's block (or single line when compact) for the filtered status view
+    
+    A block only changes with the station's status or last check, so re-applying
+    filters over an unchanged snapshot reuses the rendered text.
+    """
+    if compact:
+        return (f"{_STATUS_ICONS.get(status, '❓')} {name} • {city} • {bitrate}k • "
+                f"{language} • {status.title()} • {last_check}\n")
+    return (
+        f"{_STATUS_ICONS.get(status, '❓')} {name}\n"
+        f"   📍 {city}\n"
+        f"   🎵 {bitrate} kbps, 🗣️ {language}\n"
+        f"   🔗 Status: {status.title()}\n"
+        f"   🕐 Last Check: {last_check}\n\n"
+    )
+
+@functools.lru_cache(maxsize=1024)
+def _format_country_header(country, count) -> str:
+    """Render a country's group header for the filtered status view"""
+    return f"\n{_COUNTRY_FLAGS.get(country, '🌍')} **{country}** ({count} stations):\n"
 
 class RadioDashboard:
     """Enhanced Radio Recording Dashboard with automation and monitoring"""
     
     def __init__(self, data_file: str = 'arab_stations_radio_browser.json'):
         self.data_file = data_file
+        self.db_path = 'radio_recordings.db'
+        self._tls = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close_connections)
+        # Shared HTTP session so synchronous station checks reuse pooled connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=256, max_retries=0)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
         self.stations_by_country = {}
         self.stations_by_city = {}
         self.recording_scheduler = None
         self.scheduler_thread = None
+        # Set to wake the scheduler loop early when jobs are added or on shutdown
+        self._sched_event = threading.Event()
+        # One pool for all batch recordings, so clicks don't each spin up threads
+        # and concurrent users share a bounded number of ffmpeg workers
+        self._batch_executor = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS,
+                                                  thread_name_prefix="batch-rec")
         self.is_running = False
         self.connection_status = {}
+        # Bumped on every connection_status / station data change to invalidate
+        # the get_all_stations_status() snapshot
+        self._status_version = 0
+        self._cached_status = None
+        self._cached_status_version = -1
+        self._cached_status_time = 0.0
+        # Detailed status rows of the cached snapshot, bucketed for iter_stations_status()
+        self._status_rows_by_country = {}
+        self._status_rows_by_status = {}
+        self._status_rows_by_country_status = {}
+        # Summary block of the filtered status view, rendered with the snapshot
+        self._summary_header = ""
+        # Lookup tables rebuilt by load_stations()
+        self._countries_sorted = []
+        self._countries_with_all = ["All Countries"]
+        self._cities_by_country = {}
+        self._station_by_name = {}
+        self._station_names = {}
+        self._flat_stations_by_country = {}
+        self._flat_all_stations = []
+        self._country_counts = {}
+        self._total_stations = 0
+        # (key, markdown) of the last get_detailed_statistics() report
+        self._detailed_stats_cache = None
+        # (key, text) of the last get_recent_recordings() / get_storage_info() report
+        self._recent_recordings_cache = None
+        self._storage_info_cache = None
+        # (key, text) of the last get_filtered_stations_status() render
+        self._filtered_status_cache = None
+        # Recording directories already created by record_station()
+        self._dirs_created = set()
+        # (sql, params) rows persisted in batches by the background _db_writer() thread
+        self._write_queue = queue.Queue()
+        self._db_writer_thread = None
+        # Set once by init_database(); the schema does not change at runtime
+        self._has_conn_status_table = False
         self.recording_stats = {
             'total_recordings': 0,
             'successful_recordings': 0,
@@ -62,6 +257,29 @@ class RadioDashboard:
         self.start_scheduler()
         self.start_connection_monitor()
     
+    def _get_conn(self) -> sqlite3.Connection:
+        """Return this thread's long-lived database connection, opening it on first use"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                   cached_statements=512)
+            conn.executescript(SQLITE_PRAGMAS)
+            self._tls.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def close_connections(self):
+        """Close the database connections opened by every thread"""
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.error(f"Error closing database connection: {e}")
+            self._connections.clear()
+        self._tls = threading.local()
+    
     def init_database(self):
         """Initialize SQLite database for storing recording history"""
         try:
@@ -99,7 +317,35 @@ class RadioDashboard:
                 )
             ''')
             
+            # Create connection_status table (check history written by the monitor)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS connection_status (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    station_name TEXT NOT NULL,
+                    station_url TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    response_time REAL,
+                    country TEXT,
+                    city TEXT,
+                    last_check DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    error_message TEXT
+                )
+            ''')
+            
+            # Indexes for the statistics queries (same names as database_repair.py)
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_recordings_status ON recordings(status)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_recordings_country ON recordings(country)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_recordings_timestamp ON recordings(timestamp)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_connection_status_name ON connection_status(station_name)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_connection_status_last_check ON connection_status(last_check)')
+            # Active schedule listing (ordered by time) and cancel-by-station lookups
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_scheduled_active_time ON scheduled_recordings(is_active, schedule_time)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_scheduled_station_time ON scheduled_recordings(station_name, schedule_time)')
+            
+            self._has_conn_status_table = True
+            
             conn.commit()
+            cursor.executescript(SQLITE_PRAGMAS)
             conn.close()
             logger.info("Database initialized successfully")
         except Exception as e:
@@ -108,8 +354,9 @@ class RadioDashboard:
     def load_stations(self):
         """Load radio stations from JSON file"""
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.data_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
             
             self.stations_by_country = data.get('stations_by_country', {})
             self.stations_by_city = data.get('stations_by_city', {})
@@ -124,12 +371,83 @@ class RadioDashboard:
             logger.error(f"Error loading stations: {e}")
             self.stations_by_country = {}
             self.stations_by_city = {}
+        
+        self._build_station_indexes()
+        self._status_version += 1
+        self._cached_status = None
+    
+    def _build_station_indexes(self):
+        """Precompute country/city lists and per-location name -> station lookups"""
+        self._countries_sorted = sorted(self.stations_by_country)
+        # Choices for the bulk and status country filters
+        self._countries_with_all = ["All Countries"] + self._countries_sorted
+        self._cities_by_country = {
+            country: sorted({s['state'] for s in stations if s.get('state')})
+            for country, stations in self.stations_by_country.items()
+        }
+        # Station names are not unique across locations, so the index is
+        # keyed by (kind, location) the same way get_stations_by_location()
+        # resolves its list; the first match wins like the old linear scan.
+        self._station_by_name = {}
+        self._station_names = {}
+        for kind, groups in (('country', self.stations_by_country),
+                             ('city', self.stations_by_city)):
+            for location, stations in groups.items():
+                self._station_names[(kind, location)] = [
+                    s['name'] for s in stations[:STATION_DROPDOWN_LIMIT]
+                ]
+                by_name = self._station_by_name.setdefault((kind, location), {})
+                for station in stations:
+                    by_name.setdefault(station.get('name'), station)
+        
+        # Flattened {'name', 'url', 'country', 'city'} entries used by the bulk actions
+        self._flat_stations_by_country = {
+            country: [{
+                'name': station['name'],
+                'url': station['url'],
+                'country': country,
+                'city': station.get('state', 'Unknown')
+            } for station in stations]
+            for country, stations in self.stations_by_country.items()
+        }
+        self._flat_all_stations = [
+            station_info
+            for stations in self._flat_stations_by_country.values()
+            for station_info in stations
+        ]
+        self._country_counts = {
+            country: len(stations) for country, stations in self.stations_by_country.items()
+        }
+        self._total_stations = sum(self._country_counts.values())
+    
+    def _get_flat_stations(self, country_filter: str = None, limit: int = None):
+        """Return (stations, total) for one country or all countries
+        
+        stations holds at most limit entries; total counts every matching station.
+        """
+        if country_filter and country_filter != "All Countries":
+            stations = self._flat_stations_by_country.get(country_filter, [])
+        else:
+            stations = self._flat_all_stations
+        # The prebuilt list is shared, so only the capped references are copied
+        if limit and limit < len(stations):
+            return stations[:int(limit)], len(stations)
+        return stations, len(stations)
+    
+    def find_station(self, country: str, city: str, station_name: str) -> Optional[Dict]:
+        """Look up a station by name within the selected location"""
+        if city:
+            key = ('city', city)
+        elif country:
+            key = ('country', country)
+        else:
+            return None
+        return self._station_by_name.get(key, {}).get(station_name)
     
     def load_statistics(self):
         """Load recording statistics from database"""
         try:
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
             
             # Get total recordings
             cursor.execute("SELECT COUNT(*) FROM recordings")
@@ -152,76 +470,66 @@ class RadioDashboard:
             cursor.execute("SELECT timestamp FROM recordings ORDER BY timestamp DESC LIMIT 1")
             last_recording = cursor.fetchone()
             self.recording_stats['last_recording'] = last_recording[0] if last_recording else None
-            
-            conn.close()
         except Exception as e:
             logger.error(f"Error loading statistics: {e}")
     
     def check_station_connection(self, station_url: str, timeout: int = 10) -> bool:
         """Check if a radio station is accessible"""
         try:
-            response = requests.head(station_url, timeout=timeout, allow_redirects=True)
+            response = self._http.head(station_url, timeout=timeout, allow_redirects=True)
             return response.status_code == 200
         except:
             return False
     
+    def _set_connection_status(self, station_name: str, status_info: Dict):
+        """Record a station's latest check result and invalidate the status snapshot"""
+        self.connection_status[station_name] = status_info
+        self._status_version += 1
+    
     def start_connection_monitor(self):
         """Start enhanced background connection monitoring"""
         def monitor_connections():
             while self.is_running:
                 try:
                     # Monitor stations from different countries (rotating selection)
-                    countries_to_monitor = list(self.stations_by_country.keys())[:10]  # Monitor 10 countries
+                    countries_to_monitor = list(islice(self.stations_by_country, 10))  # Monitor 10 countries
                     
-                    for country in countries_to_monitor:
-                        stations = self.stations_by_country[country][:2]  # 2 stations per country
-                        
-                        for station in stations:
-                            start_time = time.time()
-                            status = self.check_station_connection(station['url'], timeout=8)
-                            response_time = time.time() - start_time
+                    targets = [
+                        (country, station)
+                        for country in countries_to_monitor
+                        for station in self.stations_by_country[country][:2]  # 2 stations per country
+                    ]
+                    
+                    def timed_check(url):
+                        start_time = time.time()
+                        status = self.check_station_connection(url, timeout=8)
+                        return status, time.time() - start_time
+                    
+                    # Stations live on distinct hosts, so probe them all at once;
+                    # results are recorded on this thread as they come back
+                    with ThreadPoolExecutor(max_workers=max(1, len(targets))) as executor:
+                        futures = {
+                            executor.submit(timed_check, station['url']): (country, station)
+                            for country, station in targets
+                        }
+                        for future in as_completed(futures):
+                            country, station = futures[future]
+                            status, response_time = future.result()
                             
-                            self.connection_status[station['name']] = {
+                            self._set_connection_status(station['name'], {
                                 'status': 'online' if status else 'offline',
                                 'last_check': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                                 'response_time': response_time,
                                 'country': country,
                                 'city': station.get('state', 'Unknown'),
                                 'url': station['url']
-                            }
-                            
-                            # Save to database with better error handling
-                            try:
-                                conn = sqlite3.connect('radio_recordings.db')
-                                cursor = conn.cursor()
-                                
-                                # Check if table exists first
-                                cursor.execute("""
-                                    SELECT name FROM sqlite_master 
-                                    WHERE type='table' AND name='connection_status'
-                                """)
-                                
-                                if cursor.fetchone():
-                                    cursor.execute('''
-                                        INSERT INTO connection_status 
-                                        (station_name, station_url, status, response_time, country, city, last_check)
-                                        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                                    ''', (station['name'], station['url'], 
-                                          'online' if status else 'offline', 
-                                          response_time, country, station.get('state', 'Unknown')))
-                                    conn.commit()
-                                else:
-                                    logger.warning("connection_status table does not exist, skipping database save")
-                                
-                                conn.close()
-                                
-                            except sqlite3.Error as db_error:
-                                logger.error(f"Database error in connection monitor: {db_error}")
-                                # Continue monitoring even if database fails
-                            except Exception as db_error:
-                                logger.error(f"Unexpected database error in connection monitor: {db_error}")
+                            })
                             
-                            time.sleep(1)  # Small delay between checks
+                            # Persisted by the writer thread so probes never wait on disk
+                            self._write_queue.put((INSERT_CONNECTION_CHECK_SQL, (
+                                station['name'], station['url'], 
+                                'online' if status else 'offline', 
+                                response_time, country, station.get('state', 'Unknown'))))
                     
                     # Sleep before next monitoring cycle (5 minutes)
                     time.sleep(300)
@@ -231,111 +539,196 @@ class RadioDashboard:
                     time.sleep(60)
         
         self.is_running = True
+        self._start_db_writer()
         monitor_thread = threading.Thread(target=monitor_connections, daemon=True)
         monitor_thread.start()
         logger.info("Enhanced connection monitoring started")
     
+    def _start_db_writer(self):
+        """Start the background database writer thread if it is not already running"""
+        if self._db_writer_thread is None or not self._db_writer_thread.is_alive():
+            self._db_writer_thread = threading.Thread(target=self._db_writer, daemon=True)
+            self._db_writer_thread.start()
+    
+    def _db_writer(self):
+        """Drain queued (sql, params) writes, committing each batch in one transaction
+        
+        The single writer for the connection monitor and connection tests.
+        Stops after writing the rows queued before a None sentinel.
+        """
+        conn = self._get_conn()
+        done = False
+        while not done:
+            batch = [self._write_queue.get()]
+            while len(batch) < CONNECTION_STATUS_BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            done = None in batch
+            rows_by_sql = {}
+            for item in batch:
+                if item is not None:
+                    rows_by_sql.setdefault(item[0], []).append(item[1])
+            if not rows_by_sql:
+                continue
+            
+            if not self._has_conn_status_table:
+                logger.warning("connection_status table does not exist, skipping database save")
+                continue
+            
+            try:
+                conn.execute("BEGIN")
+                for sql, rows in rows_by_sql.items():
+                    conn.executemany(sql, rows)
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.error(f"Database error saving connection results: {e}")
+    
     def start_scheduler(self):
         """Start the recording scheduler"""
         def run_scheduler():
             while self.is_running:
                 try:
+                    # Cleared before running jobs so a wake-up set meanwhile isn't lost
+                    self._sched_event.clear()
                     schedule.run_pending()
-                    time.sleep(1)
+                    # Sleep until the next job is due instead of polling every second
+                    delta = schedule.idle_seconds()
+                    self._sched_event.wait(timeout=max(0.1, 60 if delta is None else delta))
                 except Exception as e:
                     logger.error(f"Error in scheduler: {e}")
-                    time.sleep(60)
+                    self._sched_event.wait(timeout=60)
         
         self.is_running = True
         self.scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
         self.scheduler_thread.start()
     
+    def _recording_path(self, station_name: str, country: str = None, city: str = None):
+        """Return (filename, filepath) for a new recording, creating its directory"""
+        # Create organized directory structure: recordings/Country/City/
+        base_dir = "recordings"
+        country_dir = country.replace(" ", "_") if country else "Unknown_Country"
+        city_dir = city.replace(" ", "_") if city else "Unknown_City"
+        
+        # Create full directory path
+        full_dir = os.path.join(base_dir, country_dir, city_dir)
+        if full_dir not in self._dirs_created:
+            os.makedirs(full_dir, exist_ok=True)
+            self._dirs_created.add(full_dir)
+        
+        # Generate filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_name = _INVALID_FILENAME_CHARS.sub('', station_name).rstrip()
+        filename = f"{safe_name}_{timestamp}.mp3"
+        return filename, os.path.join(full_dir, filename)
+    
+    @staticmethod
+    def _ffmpeg_command(station_url: str, duration: int, filepath: str) -> List[str]:
+        """ffmpeg invocation that records duration seconds of a stream to MP3"""
+        return ['ffmpeg', '-i', station_url, '-t', str(duration), 
+                '-c:a', 'mp3', '-b:a', '128k', '-y', filepath]
+    
+    def _finish_recording(self, station_name: str, station_url: str, country: str, city: str,
+                          duration: int, filename: str, filepath: str,
+                          returncode: int, stderr: str) -> Dict:
+        """Check an ffmpeg run, persist the outcome and return the recording result"""
+        # Check if recording was successful
+        if returncode == 0 and os.path.exists(filepath):
+            file_size = os.path.getsize(filepath)
+            status = 'success'
+            error_message = None
+        else:
+            file_size = 0
+            status = 'failed'
+            error_message = stderr[:500] if stderr else "Unknown error"
+        
+        # Save to database
+        self.save_recording_to_db(station_name, station_url, country, city, 
+                                duration, filepath, status, file_size, error_message)
+        
+        # Update statistics
+        self.update_statistics(status, duration)
+        
+        return {
+            'status': status,
+            'filename': filename,
+            'duration': duration,
+            'file_size': file_size,
+            'error': error_message
+        }
+    
+    @staticmethod
+    def _failed_recording(duration: int, error: str) -> Dict:
+        """Result for a recording that could not be run to completion"""
+        return {
+            'status': 'failed',
+            'filename': None,
+            'duration': duration,
+            'file_size': 0,
+            'error': error
+        }
+    
     def record_station(self, station_name: str, station_url: str, duration: int, 
                       country: str = None, city: str = None) -> Dict:
         """Record a single radio station"""
         try:
-            # Create organized directory structure: recordings/Country/City/
-            base_dir = "recordings"
-            country_dir = country.replace(" ", "_") if country else "Unknown_Country"
-            city_dir = city.replace(" ", "_") if city else "Unknown_City"
-            
-            # Create full directory path
-            full_dir = os.path.join(base_dir, country_dir, city_dir)
-            os.makedirs(full_dir, exist_ok=True)
-            
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = "".join(c for c in station_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = f"{safe_name}_{timestamp}.mp3"
-            filepath = os.path.join(full_dir, filename)
+            filename, filepath = self._recording_path(station_name, country, city)
             
             # Record using ffmpeg
-            cmd = ['ffmpeg', '-i', station_url, '-t', str(duration), 
-                   '-c:a', 'mp3', '-b:a', '128k', '-y', filepath]
-            
+            cmd = self._ffmpeg_command(station_url, duration, filepath)
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration+30)
             
-            # Check if recording was successful
-            if result.returncode == 0 and os.path.exists(filepath):
-                file_size = os.path.getsize(filepath)
-                status = 'success'
-                error_message = None
-            else:
-                file_size = 0
-                status = 'failed'
-                error_message = result.stderr[:500] if result.stderr else "Unknown error"
-            
-            # Save to database
-            self.save_recording_to_db(station_name, station_url, country, city, 
-                                    duration, filepath, status, file_size, error_message)
-            
-            # Update statistics
-            self.update_statistics(status, duration)
-            
-            return {
-                'status': status,
-                'filename': filename,
-                'duration': duration,
-                'file_size': file_size,
-                'error': error_message
-            }
+            return self._finish_recording(station_name, station_url, country, city, duration,
+                                          filename, filepath, result.returncode, result.stderr)
             
         except subprocess.TimeoutExpired:
-            return {
-                'status': 'failed',
-                'filename': None,
-                'duration': duration,
-                'file_size': 0,
-                'error': 'Recording timeout'
-            }
+            return self._failed_recording(duration, 'Recording timeout')
         except Exception as e:
             logger.error(f"Error recording {station_name}: {e}")
-            return {
-                'status': 'failed',
-                'filename': None,
-                'duration': duration,
-                'file_size': 0,
-                'error': str(e)
-            }
+            return self._failed_recording(duration, str(e))
+    
+    async def _record_station_async(self, station_name: str, station_url: str, duration: int, 
+                                    country: str = None, city: str = None) -> Dict:
+        """Record a single radio station without tying up a thread while ffmpeg runs"""
+        try:
+            filename, filepath = self._recording_path(station_name, country, city)
+            
+            # Record using ffmpeg
+            process = await asyncio.create_subprocess_exec(
+                *self._ffmpeg_command(station_url, duration, filepath),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                _, stderr = await asyncio.wait_for(process.communicate(), timeout=duration+30)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return self._failed_recording(duration, 'Recording timeout')
+            
+            return self._finish_recording(station_name, station_url, country, city, duration,
+                                          filename, filepath, process.returncode,
+                                          stderr.decode('utf-8', errors='replace'))
+            
+        except Exception as e:
+            logger.error(f"Error recording {station_name}: {e}")
+            return self._failed_recording(duration, str(e))
     
     def save_recording_to_db(self, station_name: str, station_url: str, country: str, 
                            city: str, duration: int, filepath: str, status: str, 
                            file_size: int, error_message: str):
         """Save recording information to database"""
         try:
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO recordings 
-                (station_name, station_url, country, city, duration, file_path, 
-                 status, file_size, error_message)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (station_name, station_url, country, city, duration, filepath, 
-                  status, file_size, error_message))
+            cursor = self._get_conn().cursor()
             
-            conn.commit()
-            conn.close()
+            cursor.execute(INSERT_RECORDING_SQL, (
+                station_name, station_url, country, city, duration, filepath, 
+                status, file_size, error_message))
         except Exception as e:
             logger.error(f"Error saving recording to database: {e}")
     
@@ -362,28 +755,17 @@ class RadioDashboard:
                 logger.info(f"Interval recording result: {result}")
             
             # Schedule the job based on interval
-            if interval_minutes >= 60:
-                # For intervals >= 60 minutes, schedule hourly
-                hours = interval_minutes // 60
-                if hours == 1:
-                    schedule.every().hour.do(interval_job)
-                else:
-                    schedule.every(hours).hours.do(interval_job)
-            else:
-                # For intervals < 60 minutes, schedule by minutes
-                schedule.every(interval_minutes).minutes.do(interval_job)
+            self._interval_registrar(interval_minutes)(interval_job)
+            self._sched_event.set()
             
             # Save to database with interval info
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
             cursor.execute('''
                 INSERT INTO scheduled_recordings 
                 (station_name, station_url, schedule_time, duration, repeat_type, country, city)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (station_name, station_url, f"every_{interval_minutes}_min", 
                   duration, "interval", country, city))
-            conn.commit()
-            conn.close()
             
             return f"✅ Interval recording scheduled for {station_name} every {interval_minutes} minutes"
             
@@ -392,126 +774,197 @@ class RadioDashboard:
             return f"❌ Error scheduling interval recording: {str(e)}"
     
     def get_all_stations_status(self) -> Dict:
-        """Get connection status for all radio stations"""
+        """Get connection status for all radio stations
+        
+        The result is cached until the next connection status change, or for up to
+        STATUS_SNAPSHOT_TTL seconds while the background monitor is updating stations.
+        Reloading stations or a full connection test drops the snapshot.
+        """
         try:
-            all_stations_status = {
-                'total_stations': 0,
-                'online_stations': 0,
-                'offline_stations': 0,
-                'untested_stations': 0,
-                'by_country': {},
-                'detailed_status': []
-            }
-            
-            # Process all countries and their stations
+            version = self._status_version
+            now = time.monotonic()
+            if self._cached_status is not None and (
+                    self._cached_status_version == version
+                    or now - self._cached_status_time < STATUS_SNAPSHOT_TTL):
+                return self._cached_status
+            
+            # The counters go in the snapshot; per-station rows are bucketed by
+            # country and by status in the same pass for iter_stations_status()
+            connection_status = self.connection_status
+            by_country = {}
+            rows_by_country = {}
+            rows_by_status = defaultdict(list)
+            rows_by_country_status = defaultdict(list)
             for country, stations in self.stations_by_country.items():
-                country_stats = {
-                    'total': len(stations),
-                    'online': 0,
-                    'offline': 0,
-                    'untested': 0
-                }
-                
+                online = offline = 0
+                rows = []
                 for station in stations:
-                    all_stations_status['total_stations'] += 1
-                    
-                    # Check if we have cached status
-                    if station['name'] in self.connection_status:
-                        status_info = self.connection_status[station['name']]
-                        if status_info['status'] == 'online':
-                            all_stations_status['online_stations'] += 1
-                            country_stats['online'] += 1
+                    status_info = connection_status.get(station['name'])
+                    if status_info is not None:
+                        station_status = status_info['status']
+                        last_check = status_info.get('last_check', 'Never')
+                        if station_status == 'online':
+                            online += 1
                         else:
-                            all_stations_status['offline_stations'] += 1
-                            country_stats['offline'] += 1
+                            offline += 1
                     else:
-                        all_stations_status['untested_stations'] += 1
-                        country_stats['untested'] += 1
+                        station_status = 'untested'
+                        last_check = 'Never'
                     
-                    # Add to detailed status
-                    all_stations_status['detailed_status'].append({
+                    row = {
                         'name': station['name'],
                         'country': country,
                         'city': station.get('state', 'Unknown'),
                         'url': station['url'],
-                        'status': self.connection_status.get(station['name'], {}).get('status', 'untested'),
-                        'last_check': self.connection_status.get(station['name'], {}).get('last_check', 'Never'),
+                        'status': station_status,
+                        'last_check': last_check,
                         'bitrate': station.get('bitrate', 'Unknown'),
                         'language': station.get('language', 'Unknown')
-                    })
-                
-                all_stations_status['by_country'][country] = country_stats
+                    }
+                    rows.append(row)
+                    # Filters are matched on the lowercased status, folded once per row here
+                    status_key = station_status.lower()
+                    rows_by_status[status_key].append(row)
+                    rows_by_country_status[(country, status_key)].append(row)
+                rows_by_country[country] = rows
+                by_country[country] = {
+                    'total': len(stations),
+                    'online': online,
+                    'offline': offline,
+                    'untested': len(stations) - online - offline
+                }
             
+            all_stations_status = {
+                'total_stations': sum(c['total'] for c in by_country.values()),
+                'online_stations': sum(c['online'] for c in by_country.values()),
+                'offline_stations': sum(c['offline'] for c in by_country.values()),
+                'untested_stations': sum(c['untested'] for c in by_country.values()),
+                'by_country': by_country
+            }
+            
+            self._status_rows_by_country = rows_by_country
+            self._status_rows_by_status = dict(rows_by_status)
+            self._status_rows_by_country_status = dict(rows_by_country_status)
+            self._summary_header = self._format_summary_header(all_stations_status)
+            self._cached_status = all_stations_status
+            self._cached_status_version = version
+            self._cached_status_time = now
             return all_stations_status
             
         except Exception as e:
             logger.error(f"Error getting all stations status: {e}")
             return {'error': str(e)}
     
-    def test_all_stations_connection(self, max_workers: int = 10) -> str:
-        """Test connection for all radio stations with threading"""
+    @staticmethod
+    def _format_summary_header(stations_status: Dict) -> str:
+        """Render the summary block of the filtered status view from snapshot counts"""
+        total = stations_status['total_stations']
+        online = stations_status['online_stations']
+        offline = stations_status['offline_stations']
+        untested = stations_status['untested_stations']
+        online_pct, offline_pct, untested_pct = (
+            (count / total * 100) if total > 0 else 0
+            for count in (online, offline, untested)
+        )
+        return f"""
+🌐 **Complete Radio Stations Status**
+
+📊 **Summary:**
+• Total Stations: {total}
+• Online: {online} ({online_pct:.1f}%)
+• Offline: {offline} ({offline_pct:.1f}%)
+• Untested: {untested} ({untested_pct:.1f}%)
+
+"""
+    
+    def iter_stations_status(self, country: str = None, status: str = None):
+        """Yield detailed status rows, optionally limited to one country and/or status
+        
+        Rows are shared with the get_all_stations_status() snapshot and must not be modified.
+        """
+        self.get_all_stations_status()
+        if country is not None and status is not None:
+            rows = self._status_rows_by_country_status.get((country, status.lower()), [])
+        elif country is not None:
+            rows = self._status_rows_by_country.get(country, [])
+        elif status is not None:
+            rows = self._status_rows_by_status.get(status.lower(), [])
+        else:
+            rows = chain.from_iterable(self._status_rows_by_country.values())
+        yield from rows
+    
+    async def _probe_stations_async(self, station_infos: List[Dict], on_result,
+                                    timeout: int = 5, max_concurrent: int = 100) -> List[bool]:
+        """HEAD-probe every station URL concurrently on one event loop
+        
+        on_result(station_info, online) is called as each probe finishes.
+        Probes are grouped by host so stations behind a shared CDN reuse its connections.
+        At most max_concurrent probes are in flight, so queued probes never wait on
+        the connection pool with their timeout running.
+        """
+        slots = asyncio.Semaphore(max_concurrent)
+        host_slots = defaultdict(lambda: asyncio.Semaphore(PROBE_MAX_PER_HOST))
+        limits = httpx.Limits(max_connections=max_concurrent, max_keepalive_connections=max_concurrent)
+        async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True,
+                                     http2=HTTP2_AVAILABLE) as client:
+            async def probe(station_info):
+                try:
+                    async with host_slots[urlparse(station_info['url']).netloc], slots:
+                        response = await client.head(station_info['url'])
+                    online = response.status_code == 200
+                except Exception:
+                    online = False
+                on_result(station_info, online)
+                return online
+            
+            return await asyncio.gather(*(probe(station_info) for station_info in station_infos),
+                                        return_exceptions=True)
+    
+    def test_all_stations_connection(self, max_concurrent: int = 100) -> str:
+        """Test connection for all radio stations with concurrent async probes"""
         try:
-            all_stations = []
-            for country, stations in self.stations_by_country.items():
-                for station in stations:
-                    all_stations.append({
-                        'name': station['name'],
-                        'url': station['url'],
-                        'country': country,
-                        'city': station.get('state', 'Unknown')
-                    })
-            
+            all_stations = self._flat_all_stations
             total_stations = len(all_stations)
-            tested_count = 0
-            online_count = 0
-            
-            def test_station(station_info):
-                nonlocal tested_count, online_count
-                try:
-                    status = self.check_station_connection(station_info['url'], timeout=5)
-                    tested_count += 1
-                    
-                    if status:
-                        online_count += 1
-                    
-                    # Update connection status cache
-                    self.connection_status[station_info['name']] = {
-                        'status': 'online' if status else 'offline',
-                        'last_check': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        'country': station_info['country'],
-                        'city': station_info['city']
-                    }
-                    
-                    # Save to database
-                    conn = sqlite3.connect('radio_recordings.db')
-                    cursor = conn.cursor()
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO connection_status 
-                        (station_name, station_url, status, last_check)
-                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                    ''', (station_info['name'], station_info['url'], 
-                          'online' if status else 'offline'))
-                    conn.commit()
-                    conn.close()
-                    
-                    return f"{'✅' if status else '❌'} {station_info['name']} ({station_info['country']})"
-                    
-                except Exception as e:
-                    return f"❌ {station_info['name']}: Error - {str(e)[:50]}"
             
-            # Test stations with threading
+            # Results are persisted in batches by the shared database writer
+            self._start_db_writer()
+            
+            def record_result(station_info, status):
+                # Update connection status cache
+                self._set_connection_status(station_info['name'], {
+                    'status': 'online' if status else 'offline',
+                    'last_check': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'country': station_info['country'],
+                    'city': station_info['city']
+                })
+                
+                # Queue for the database writer
+                self._write_queue.put((UPSERT_CONNECTION_STATUS_SQL, (
+                    station_info['name'], station_info['url'],
+                    'online' if status else 'offline')))
+            
+            try:
+                statuses = asyncio.run(self._probe_stations_async(
+                    all_stations, record_result, timeout=5, max_concurrent=max_concurrent
+                ))
+            finally:
+                # Every station changed, so don't serve the TTL snapshot
+                self._cached_status = None
+            
+            # Only the first 50 result lines are shown, so only those are formatted
             results = []
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_station = {executor.submit(test_station, station): station 
-                                   for station in all_stations}
+            tested_count = 0
+            online_count = 0
+            for station_info, status in zip(all_stations, statuses):
+                if isinstance(status, BaseException):
+                    if len(results) < 50:
+                        results.append(f"❌ {station_info['name']}: Error - {str(status)[:50]}")
+                    continue
                 
-                for future in future_to_station:
-                    try:
-                        result = future.result(timeout=10)
-                        results.append(result)
-                    except Exception as e:
-                        station = future_to_station[future]
-                        results.append(f"❌ {station['name']}: Timeout")
+                tested_count += 1
+                online_count += status
+                if len(results) < 50:
+                    results.append(f"{'✅' if status else '❌'} {station_info['name']} ({station_info['country']})")
             
             # Generate summary
             success_rate = (online_count / tested_count * 100) if tested_count > 0 else 0
@@ -526,11 +979,11 @@ class RadioDashboard:
 • Success Rate: {success_rate:.1f}%
 
 📋 **Detailed Results:**
-{chr(10).join(results[:50])}  # Show first 50 results
+{chr(10).join(results)}  # Show first 50 results
 """
             
-            if len(results) > 50:
-                summary += f"\n... and {len(results) - 50} more stations"
+            if len(statuses) > 50:
+                summary += f"\n... and {len(statuses) - 50} more stations"
             
             return summary
             
@@ -544,9 +997,20 @@ class RadioDashboard:
             # Get all stations status
             stations_status = self.get_all_stations_status()
             
+            # Reuse the last report while nothing it depends on has changed,
+            # refreshing at least every DETAILED_STATS_TTL seconds; the status part
+            # is keyed on the snapshot the report is built from
+            cache_key = (
+                self._cached_status_time,
+                self.recording_stats['total_recordings'],
+                self.recording_stats['last_recording'],
+                int(time.time() // DETAILED_STATS_TTL),
+            )
+            if self._detailed_stats_cache and self._detailed_stats_cache[0] == cache_key:
+                return self._detailed_stats_cache[1]
+            
             # Get recording statistics by country
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
             
             # Total recordings by status
             cursor.execute('''
@@ -570,7 +1034,7 @@ class RadioDashboard:
             cursor.execute('''
                 SELECT COUNT(*) 
                 FROM recordings 
-                WHERE datetime(timestamp) > datetime('now', '-1 day')
+                WHERE timestamp > datetime('now', '-1 day')
             ''')
             recent_recordings = cursor.fetchone()[0]
             
@@ -582,8 +1046,6 @@ class RadioDashboard:
             ''')
             avg_duration = cursor.fetchone()[0] or 0
             
-            conn.close()
-            
             # Build detailed statistics display
             stats_display = f"""
 📊 **Comprehensive Dashboard Statistics**
@@ -632,11 +1094,12 @@ class RadioDashboard:
             
             # Add stations by country breakdown
             stats_display += f"\n\n🗺️ **Stations by Country:**"
-            for country, country_data in sorted(stations_status['by_country'].items(), 
-                                              key=lambda x: x[1]['total'], reverse=True)[:15]:
+            for country, country_data in heapq.nlargest(15, stations_status['by_country'].items(),
+                                                        key=lambda x: x[1]['total']):
                 stats_display += f"\n• {country}: {country_data['total']} stations "
                 stats_display += f"({country_data['online']} online, {country_data['offline']} offline, {country_data['untested']} untested)"
             
+            self._detailed_stats_cache = (cache_key, stats_display)
             return stats_display
             
         except Exception as e:
@@ -645,32 +1108,31 @@ class RadioDashboard:
     
     def get_countries(self) -> List[str]:
         """Get list of available countries"""
-        return sorted(list(self.stations_by_country.keys()))
+        return self._countries_sorted
     
     def get_cities_by_country(self, country: str) -> List[str]:
-        """Get cities for a specific country"""
-        try:
-            if not country:
-                return []
-            
-            cities = set()
+        """Get cities for a specific country (served from the prebuilt index)"""
+        if not country:
+            return []
+        return self._cities_by_country.get(country, [])
+    
+    def get_stations_by_location(self, country: str, city: str = None,
+                                 limit: int = None) -> List[Dict]:
+        """Get stations by location, at most limit of them when given"""
+        if city:
+            stations = self.stations_by_city.get(city, [])
+        elif country:
             stations = self.stations_by_country.get(country, [])
-            
-            for station in stations:
-                if station.get('state'):
-                    cities.add(station['state'])
-            
-            return sorted(list(cities))
-        except Exception as e:
-            logger.error(f"Error getting cities for {country}: {e}")
+        else:
             return []
+        return stations[:int(limit)] if limit else stations
     
-    def get_stations_by_location(self, country: str, city: str = None) -> List[Dict]:
-        """Get stations by location"""
+    def get_station_names(self, country: str, city: str = None) -> List[str]:
+        """Get the (prebuilt, limited) station name choices for a location"""
         if city:
-            return self.stations_by_city.get(city, [])
+            return self._station_names.get(('city', city), [])
         elif country:
-            return self.stations_by_country.get(country, [])
+            return self._station_names.get(('country', country), [])
         return []
     
     def get_statistics_display(self) -> str:
@@ -678,7 +1140,7 @@ class RadioDashboard:
         stats = self.recording_stats
         success_rate = (stats['successful_recordings'] / stats['total_recordings'] * 100) if stats['total_recordings'] > 0 else 0
         
-        display = f"""
+        parts = [f"""
 📊 **Recording Statistics**
 
 📈 Total Recordings: {stats['total_recordings']}
@@ -689,44 +1151,53 @@ class RadioDashboard:
 🕐 Last Recording: {stats['last_recording'] or 'Never'}
 
 🔗 **Connection Status**
-"""
+"""]
         
         for station, status in self.connection_status.items():
-            status_icon = "🟢" if status['status'] == 'online' else "🔴"
-            display += f"{status_icon} {station}: {status['status']} (checked: {status['last_check']})\n"
+            status_icon = _STATUS_ICONS.get(status['status'], '🔴')
+            parts.append(f"{status_icon} {station}: {status['status']} (checked: {status['last_check']})\n")
         
-        return display
+        return ''.join(parts)
     
     def get_recent_recordings(self) -> str:
         """Get recent recordings from database"""
         try:
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
+            # Any new recording bumps total_recordings, so only tab switches and
+            # repeated refreshes within REPORT_CACHE_TTL hit the cache
+            cache_key = (self.recording_stats['total_recordings'],
+                         int(time.time() // REPORT_CACHE_TTL))
+            if self._recent_recordings_cache and self._recent_recordings_cache[0] == cache_key:
+                return self._recent_recordings_cache[1]
+            
+            cursor = self._get_conn().cursor()
             
             cursor.execute('''
                 SELECT station_name, status, duration, timestamp, file_size
-                FROM recordings 
+                FROM recordings INDEXED BY idx_recordings_timestamp
                 ORDER BY timestamp DESC 
                 LIMIT 10
             ''')
             
             recordings = cursor.fetchall()
-            conn.close()
             
             if not recordings:
-                return "No recordings found"
+                report = "No recordings found"
+                self._recent_recordings_cache = (cache_key, report)
+                return report
             
-            display = "🎵 **Recent Recordings**\n\n"
+            parts = ["🎵 **Recent Recordings**\n\n"]
             for record in recordings:
                 station, status, duration, timestamp, file_size = record
                 status_icon = "✅" if status == 'success' else "❌"
                 file_size_mb = file_size / (1024*1024) if file_size else 0
                 
-                display += f"{status_icon} {station}\n"
-                display += f"   📅 {timestamp}\n"
-                display += f"   ⏱️ {duration}s, 📁 {file_size_mb:.1f}MB\n\n"
+                parts.append(f"{status_icon} {station}\n")
+                parts.append(f"   📅 {timestamp}\n")
+                parts.append(f"   ⏱️ {duration}s, 📁 {file_size_mb:.1f}MB\n\n")
             
-            return display
+            report = ''.join(parts)
+            self._recent_recordings_cache = (cache_key, report)
+            return report
             
         except Exception as e:
             logger.error(f"Error getting recent recordings: {e}")
@@ -736,14 +1207,7 @@ class RadioDashboard:
                      duration: int) -> str:
         """Manual recording trigger"""
         try:
-            stations = self.get_stations_by_location(country, city)
-            
-            # Find the selected station
-            selected_station = None
-            for station in stations:
-                if station['name'] == station_name:
-                    selected_station = station
-                    break
+            selected_station = self.find_station(country, city, station_name)
             
             if not selected_station:
                 return f"❌ Station '{station_name}' not found"
@@ -769,8 +1233,7 @@ class RadioDashboard:
     def get_scheduled_recordings(self) -> str:
         """Get list of scheduled recordings"""
         try:
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
+            cursor = self._get_conn().cursor()
             
             cursor.execute('''
                 SELECT station_name, schedule_time, duration, repeat_type, is_active, created_at
@@ -780,21 +1243,20 @@ class RadioDashboard:
             ''')
             
             recordings = cursor.fetchall()
-            conn.close()
             
             if not recordings:
                 return "No scheduled recordings"
             
-            display = "⏰ **Scheduled Recordings**\n\n"
+            parts = ["⏰ **Scheduled Recordings**\n\n"]
             for record in recordings:
                 station, sched_time, duration, repeat_type, is_active, created_at = record
                 
-                display += f"🎵 {station}\n"
-                display += f"   ⏰ Time: {sched_time} ({repeat_type})\n"
-                display += f"   ⏱️ Duration: {duration}s\n"
-                display += f"   📅 Created: {created_at}\n\n"
+                parts.append(f"🎵 {station}\n")
+                parts.append(f"   ⏰ Time: {sched_time} ({repeat_type})\n")
+                parts.append(f"   ⏱️ Duration: {duration}s\n")
+                parts.append(f"   📅 Created: {created_at}\n\n")
             
-            return display
+            return ''.join(parts)
             
         except Exception as e:
             logger.error(f"Error getting scheduled recordings: {e}")
@@ -803,21 +1265,16 @@ class RadioDashboard:
     def cancel_scheduled_recording(self, station_name: str, schedule_time: str) -> str:
         """Cancel a scheduled recording"""
         try:
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
+            # Single autocommit UPDATE via idx_scheduled_station_time
+            affected = self._get_conn().execute('''
                 UPDATE scheduled_recordings 
                 SET is_active = FALSE 
                 WHERE station_name = ? AND schedule_time = ?
-            ''', (station_name, schedule_time))
+            ''', (station_name, schedule_time)).rowcount
             
-            if cursor.rowcount > 0:
-                conn.commit()
-                conn.close()
+            if affected > 0:
                 return f"✅ Cancelled scheduled recording for {station_name} at {schedule_time}"
             else:
-                conn.close()
                 return f"❌ No scheduled recording found for {station_name} at {schedule_time}"
                 
         except Exception as e:
@@ -827,76 +1284,68 @@ class RadioDashboard:
     def export_recordings_data(self) -> str:
         """Export recordings data to CSV"""
         try:
-            import csv
-            conn = sqlite3.connect('radio_recordings.db')
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT station_name, station_url, country, city, duration, 
-                       status, timestamp, file_size, error_message
-                FROM recordings 
-                ORDER BY timestamp DESC
-            ''')
-            
-            recordings = cursor.fetchall()
-            conn.close()
-            
-            if not recordings:
-                return "No recordings to export"
-            
             # Create CSV file
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             csv_filename = f"recordings_export_{timestamp}.csv"
             
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                writer.writerow(['Station Name', 'Station URL', 'Country', 'City', 
-                               'Duration', 'Status', 'Timestamp', 'File Size', 'Error Message'])
-                writer.writerows(recordings)
+            if pd is not None:
+                exported = self._export_recordings_pandas(csv_filename)
+            else:
+                exported = self._export_recordings_csv(csv_filename)
+            
+            if not exported:
+                return "No recordings to export"
             
-            return f"✅ Exported {len(recordings)} recordings to {csv_filename}"
+            return f"✅ Exported {exported} recordings to {csv_filename}"
             
         except Exception as e:
             logger.error(f"Error exporting recordings: {e}")
             return f"❌ Export error: {str(e)}"
     
+    def _export_recordings_pandas(self, csv_filename: str) -> int:
+        """Write the recordings CSV in pandas chunks; returns the row count (0 = no file written)"""
+        # dtype=object keeps integers and NULLs exactly as csv.writer would write them
+        chunks = pd.read_sql_query(EXPORT_RECORDINGS_SQL, self._get_conn(),
+                                   chunksize=EXPORT_CHUNK_ROWS, dtype=object)
+        first_chunk = next(chunks, None)
+        if first_chunk is None or first_chunk.empty:
+            return 0
+        
+        exported = len(first_chunk)
+        with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            first_chunk.to_csv(csvfile, header=EXPORT_HEADER, index=False, lineterminator='\r\n')
+            for chunk in chunks:
+                chunk.to_csv(csvfile, header=False, index=False, lineterminator='\r\n')
+                exported += len(chunk)
+        return exported
+    
+    def _export_recordings_csv(self, csv_filename: str) -> int:
+        """Write the recordings CSV row by row from the cursor; returns the row count"""
+        import csv
+        cursor = self._get_conn().execute(EXPORT_RECORDINGS_SQL)
+        
+        # Stream rows from the cursor instead of materializing the whole table
+        first_row = cursor.fetchone()
+        if first_row is None:
+            return 0
+        
+        exported = 1
+        with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(EXPORT_HEADER)
+            writer.writerow(first_row)
+            for row in cursor:
+                writer.writerow(row)
+                exported += 1
+        return exported
+    
     def schedule_all_stations_recording(self, interval_minutes: int, duration: int, 
                                        country_filter: str = None, max_stations: int = None) -> str:
         """Schedule recording for all radio stations with optional filtering"""
         try:
-            all_stations = []
-            total_stations = 0
-            
-            # Collect all stations based on filter
-            if country_filter and country_filter != "All Countries":
-                # Record all stations from specific country
-                stations = self.stations_by_country.get(country_filter, [])
-                for station in stations:
-                    all_stations.append({
-                        'name': station['name'],
-                        'url': station['url'],
-                        'country': country_filter,
-                        'city': station.get('state', 'Unknown')
-                    })
-                total_stations = len(stations)
-            else:
-                # Record all stations from all countries
-                for country, stations in self.stations_by_country.items():
-                    for station in stations:
-                        all_stations.append({
-                            'name': station['name'],
-                            'url': station['url'],
-                            'country': country,
-                            'city': station.get('state', 'Unknown')
-                        })
-                        total_stations += 1
-            
-            # Apply max stations limit if specified
-            if max_stations and max_stations < len(all_stations):
-                all_stations = all_stations[:max_stations]
-                limited_count = max_stations
-            else:
-                limited_count = len(all_stations)
+            # Collect stations based on filter, capped at max_stations if specified
+            all_stations, total_stations = self._get_flat_stations(country_filter, max_stations)
+            limited_count = len(all_stations)
             
             # Create staggered recording jobs to avoid overwhelming the system
             scheduled_count = 0
@@ -905,61 +1354,48 @@ class RadioDashboard:
             # Calculate stagger delay (spread recordings over time to avoid system overload)
             stagger_seconds = max(10, interval_minutes * 60 // limited_count) if limited_count > 0 else 60
             
+            # scheduled_recordings rows, written in one transaction after the loop
+            rows = []
+            register = self._interval_registrar(interval_minutes)
+            
             for i, station_info in enumerate(all_stations):
                 try:
-                    # Create recording job for each station
-                    def create_job(station_data, delay_offset):
-                        def job():
-                            # Add small delay to stagger the recordings
-                            time.sleep(delay_offset)
-                            logger.info(f"Executing bulk recording: {station_data['name']} ({station_data['country']})")
-                            result = self.record_station(
-                                station_data['name'],
-                                station_data['url'],
-                                duration,
-                                station_data['country'],
-                                station_data['city']
-                            )
-                            logger.info(f"Bulk recording result for {station_data['name']}: {result['status']}")
-                        return job
-                    
                     # Calculate delay for this station (stagger recordings)
                     delay_offset = (i % 10) * stagger_seconds  # Group in batches of 10
                     
                     # Schedule the job based on interval
-                    job = create_job(station_info, delay_offset)
-                    
-                    if interval_minutes >= 60:
-                        # For intervals >= 60 minutes, schedule hourly
-                        hours = interval_minutes // 60
-                        if hours == 1:
-                            schedule.every().hour.do(job)
-                        else:
-                            schedule.every(hours).hours.do(job)
-                    else:
-                        # For intervals < 60 minutes, schedule by minutes
-                        schedule.every(interval_minutes).minutes.do(job)
-                    
-                    # Save to database
-                    conn = sqlite3.connect('radio_recordings.db')
-                    cursor = conn.cursor()
-                    cursor.execute('''
-                        INSERT INTO scheduled_recordings 
-                        (station_name, station_url, schedule_time, duration, repeat_type, 
-                         interval_minutes, country, city)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (station_info['name'], station_info['url'], 
-                          f"every_{interval_minutes}_min_bulk", duration, "interval_bulk",
-                          interval_minutes, station_info['country'], station_info['city']))
-                    conn.commit()
-                    conn.close()
+                    register(functools.partial(self._bulk_record_job, station_info, delay_offset, duration))
                     
+                    rows.append((station_info['name'], station_info['url'], 
+                                 f"every_{interval_minutes}_min_bulk", duration, "interval_bulk",
+                                 interval_minutes, station_info['country'], station_info['city']))
                     scheduled_count += 1
                     
                 except Exception as e:
                     logger.error(f"Error scheduling {station_info['name']}: {e}")
                     failed_count += 1
             
+            self._sched_event.set()
+            
+            # Save to database
+            if rows:
+                conn = self._get_conn()
+                try:
+                    conn.execute("BEGIN")
+                    conn.executemany('''
+                        INSERT INTO scheduled_recordings 
+                        (station_name, station_url, schedule_time, duration, repeat_type, 
+                         interval_minutes, country, city)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', rows)
+                    conn.execute("COMMIT")
+                except sqlite3.Error as e:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+                    logger.error(f"Error saving bulk schedule: {e}")
+                    scheduled_count -= len(rows)
+                    failed_count += len(rows)
+            
             result_message = f"""
 ✅ **Bulk Recording Scheduled Successfully!**
 
@@ -994,115 +1430,84 @@ class RadioDashboard:
             logger.error(f"Error scheduling bulk recording: {e}")
             return f"❌ Error scheduling bulk recording: {str(e)}"
     
+    @staticmethod
+    def _interval_registrar(interval_minutes: int):
+        """Return a callable that schedules a job every interval_minutes"""
+        if interval_minutes >= 60:
+            # For intervals >= 60 minutes, schedule hourly
+            hours = interval_minutes // 60
+            if hours == 1:
+                return lambda job: schedule.every().hour.do(job)
+            return lambda job: schedule.every(hours).hours.do(job)
+        # For intervals < 60 minutes, schedule by minutes
+        return lambda job: schedule.every(interval_minutes).minutes.do(job)
+    
+    def _bulk_record_job(self, station_data: Dict, delay_offset: int, duration: int):
+        """Scheduled job body for one station of a bulk interval recording"""
+        # Add small delay to stagger the recordings
+        time.sleep(delay_offset)
+        logger.info(f"Executing bulk recording: {station_data['name']} ({station_data['country']})")
+        result = self.record_station(
+            station_data['name'],
+            station_data['url'],
+            duration,
+            station_data['country'],
+            station_data['city']
+        )
+        logger.info(f"Bulk recording result for {station_data['name']}: {result['status']}")
+    
     def record_all_stations_now(self, duration: int, country_filter: str = None, 
                                max_concurrent: int = 5, max_stations: int = None) -> str:
         """Record all radio stations immediately with parallel processing"""
         try:
-            all_stations = []
-            total_stations = 0
-            
-            # Collect all stations based on filter
-            if country_filter and country_filter != "All Countries":
-                stations = self.stations_by_country.get(country_filter, [])
-                for station in stations:
-                    all_stations.append({
-                        'name': station['name'],
-                        'url': station['url'],
-                        'country': country_filter,
-                        'city': station.get('state', 'Unknown')
-                    })
-                total_stations = len(stations)
-            else:
-                for country, stations in self.stations_by_country.items():
-                    for station in stations:
-                        all_stations.append({
-                            'name': station['name'],
-                            'url': station['url'],
-                            'country': country,
-                            'city': station.get('state', 'Unknown')
-                        })
-                        total_stations += 1
-            
-            # Apply max stations limit
-            if max_stations and max_stations < len(all_stations):
-                all_stations = all_stations[:max_stations]
+            # Collect stations based on filter, capped at max_stations if specified
+            all_stations, total_stations = self._get_flat_stations(country_filter, max_stations)
             
             if not all_stations:
                 return f"❌ No stations found for recording"
             
-            # Record all stations with threading
-            results = []
-            successful_recordings = 0
-            failed_recordings = 0
-            
-            def record_single_station(station_info):
-                try:
-                    result = self.record_station(
-                        station_info['name'],
-                        station_info['url'],
-                        duration,
-                        station_info['country'],
-                        station_info['city']
-                    )
-                    return {
-                        'station': station_info['name'],
-                        'country': station_info['country'],
-                        'status': result['status'],
-                        'filename': result.get('filename', 'N/A'),
-                        'error': result.get('error', None)
-                    }
-                except Exception as e:
-                    return {
-                        'station': station_info['name'],
-                        'country': station_info['country'],
-                        'status': 'failed',
-                        'filename': 'N/A',
-                        'error': str(e)
-                    }
-            
-            # Process in batches to avoid overwhelming the system
-            batch_size = max_concurrent
-            total_batches = (len(all_stations) + batch_size - 1) // batch_size
-            
-            for batch_num in range(total_batches):
-                start_idx = batch_num * batch_size
-                end_idx = min(start_idx + batch_size, len(all_stations))
-                batch_stations = all_stations[start_idx:end_idx]
-                
-                logger.info(f"Processing batch {batch_num + 1}/{total_batches} ({len(batch_stations)} stations)")
+            # Record all stations as ffmpeg subprocesses driven from one event loop;
+            # the semaphore caps how many run at once
+            async def record_all():
+                semaphore = asyncio.Semaphore(max_concurrent)
                 
-                with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-                    batch_futures = [executor.submit(record_single_station, station) 
-                                   for station in batch_stations]
-                    
-                    for future in batch_futures:
+                async def record_single_station(station_info):
+                    async with semaphore:
                         try:
-                            result = future.result(timeout=duration + 60)
-                            results.append(result)
-                            
-                            if result['status'] == 'success':
-                                successful_recordings += 1
-                            else:
-                                failed_recordings += 1
-                                
+                            result = await self._record_station_async(
+                                station_info['name'],
+                                station_info['url'],
+                                duration,
+                                station_info['country'],
+                                station_info['city']
+                            )
+                            return {
+                                'station': station_info['name'],
+                                'country': station_info['country'],
+                                'status': result['status'],
+                                'filename': result.get('filename', 'N/A'),
+                                'error': result.get('error', None)
+                            }
                         except Exception as e:
-                            failed_recordings += 1
-                            results.append({
-                                'station': 'Unknown',
-                                'country': 'Unknown',
+                            return {
+                                'station': station_info['name'],
+                                'country': station_info['country'],
                                 'status': 'failed',
                                 'filename': 'N/A',
-                                'error': f"Timeout or error: {str(e)}"
-                            })
+                                'error': str(e)
+                            }
                 
-                # Small delay between batches
-                if batch_num < total_batches - 1:
-                    time.sleep(2)
+                return await asyncio.gather(*(record_single_station(station) for station in all_stations))
+            
+            logger.info(f"Recording {len(all_stations)} stations, {max_concurrent} at a time")
+            results = asyncio.run(record_all())
+            successful_recordings = sum(1 for result in results if result['status'] == 'success')
+            failed_recordings = len(results) - successful_recordings
             
             # Generate detailed results
             success_rate = (successful_recordings / len(results) * 100) if results else 0
             
-            result_summary = f"""
+            parts = [f"""
 🎵 **Bulk Recording Completed!**
 
 📊 **Summary:**
@@ -1118,48 +1523,66 @@ class RadioDashboard:
 • Estimated total size: ~{(successful_recordings * duration * 128) // 8192} MB
 
 🎯 **Results by Country:**
-"""
+"""]
             
             # Group results by country
-            results_by_country = {}
+            results_by_country = defaultdict(lambda: {'success': 0, 'failed': 0, 'stations': []})
             for result in results:
-                country = result['country']
-                if country not in results_by_country:
-                    results_by_country[country] = {'success': 0, 'failed': 0, 'stations': []}
-                
-                if result['status'] == 'success':
-                    results_by_country[country]['success'] += 1
-                else:
-                    results_by_country[country]['failed'] += 1
-                
-                results_by_country[country]['stations'].append(result)
+                bucket = results_by_country[result['country']]
+                bucket['success' if result['status'] == 'success' else 'failed'] += 1
+                bucket['stations'].append(result)
             
             # Display country summaries
             for country, country_data in sorted(results_by_country.items()):
                 total_country = country_data['success'] + country_data['failed']
                 country_rate = (country_data['success'] / total_country * 100) if total_country > 0 else 0
                 
-                result_summary += f"\n🌍 {country}: {country_data['success']}/{total_country} successful ({country_rate:.1f}%)"
+                parts.append(f"\n🌍 {country}: {country_data['success']}/{total_country} successful ({country_rate:.1f}%)")
             
             # Show first 20 detailed results
-            result_summary += f"\n\n📋 **Detailed Results** (showing first 20):"
+            parts.append(f"\n\n📋 **Detailed Results** (showing first 20):")
             for i, result in enumerate(results[:20]):
                 status_icon = "✅" if result['status'] == 'success' else "❌"
-                result_summary += f"\n{status_icon} {result['station']} ({result['country']})"
+                parts.append(f"\n{status_icon} {result['station']} ({result['country']})")
                 if result['status'] == 'success':
-                    result_summary += f" → {result['filename']}"
+                    parts.append(f" → {result['filename']}")
                 else:
-                    result_summary += f" → {result['error'][:50]}..."
+                    parts.append(f" → {result['error'][:50]}...")
             
             if len(results) > 20:
-                result_summary += f"\n... and {len(results) - 20} more results"
+                parts.append(f"\n... and {len(results) - 20} more results")
             
-            return result_summary
+            return ''.join(parts)
             
         except Exception as e:
             logger.error(f"Error in bulk recording: {e}")
             return f"❌ Bulk recording error: {str(e)}"
     
+    @staticmethod
+    def _scan_recordings(path: str, location: tuple = ()):
+        """Yield (path, location, stat) for every .mp3 under path
+        
+        Walks the tree with scandir so each file costs a single DirEntry.stat();
+        location is (country, city) taken from the first two directory levels.
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from RadioDashboard._scan_recordings(
+                        entry.path, location if len(location) >= 2 else location + (entry.name,))
+                elif entry.name.endswith('.mp3'):
+                    yield entry.path, location, entry.stat()
+    
+    @staticmethod
+    def _remove_recording(path: str) -> bool:
+        """Delete one recording file; returns False (and logs) if it could not be removed"""
+        try:
+            os.remove(path)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not delete {path}: {e}")
+            return False
+    
     def get_storage_info(self) -> str:
         """Get detailed storage information for recordings with folder structure"""
         try:
@@ -1167,38 +1590,34 @@ class RadioDashboard:
             if not os.path.exists(recordings_dir):
                 return "📁 No recordings directory found"
             
+            # Same reuse rule as get_recent_recordings(); cleanup drops the entry
+            cache_key = (self.recording_stats['total_recordings'],
+                         int(time.time() // REPORT_CACHE_TTL))
+            if self._storage_info_cache and self._storage_info_cache[0] == cache_key:
+                return self._storage_info_cache[1]
+            
             total_size = 0
             file_count = 0
             folder_structure = {}
             
-            # Walk through the directory structure
-            for root, dirs, files in os.walk(recordings_dir):
-                path_parts = root.replace(recordings_dir, "").strip(os.sep).split(os.sep)
+            for _, location, st in self._scan_recordings(recordings_dir):
+                file_size = st.st_size
+                total_size += file_size
+                file_count += 1
                 
-                for file in files:
-                    if file.endswith('.mp3'):
-                        file_path = os.path.join(root, file)
-                        file_size = os.path.getsize(file_path)
-                        total_size += file_size
-                        file_count += 1
-                        
-                        # Organize by country/city structure
-                        if len(path_parts) >= 2 and path_parts[0]:
-                            country = path_parts[0].replace("_", " ")
-                            city = path_parts[1].replace("_", " ") if len(path_parts) > 1 else "Unknown"
-                            
-                            if country not in folder_structure:
-                                folder_structure[country] = {}
-                            if city not in folder_structure[country]:
-                                folder_structure[country][city] = {'files': 0, 'size': 0}
-                            
-                            folder_structure[country][city]['files'] += 1
-                            folder_structure[country][city]['size'] += file_size
+                # Organize by country/city structure
+                if len(location) >= 2:
+                    country = location[0].replace("_", " ")
+                    city = location[1].replace("_", " ")
+                    city_data = folder_structure.setdefault(country, {}).setdefault(
+                        city, {'files': 0, 'size': 0})
+                    city_data['files'] += 1
+                    city_data['size'] += file_size
             
             total_size_mb = total_size / (1024 * 1024)
             total_size_gb = total_size_mb / 1024
             
-            storage_info = f"""
+            parts = [f"""
 📁 **Storage Information**
 
 📊 **Summary:**
@@ -1207,34 +1626,325 @@ class RadioDashboard:
 • Directory: {os.path.abspath(recordings_dir)}
 
 🗂️ **Folder Structure:**
-"""
+"""]
             
             # Display folder structure organized by country/city
             for country, cities in sorted(folder_structure.items()):
                 country_files = sum(city_data['files'] for city_data in cities.values())
                 country_size = sum(city_data['size'] for city_data in cities.values()) / (1024 * 1024)
                 
-                storage_info += f"\n📍 {country} ({country_files} files, {country_size:.1f} MB)\n"
+                parts.append(f"\n📍 {country} ({country_files} files, {country_size:.1f} MB)\n")
                 
                 for city, city_data in sorted(cities.items()):
                     city_size_mb = city_data['size'] / (1024 * 1024)
-                    storage_info += f"   └── {city}: {city_data['files']} files, {city_size_mb:.1f} MB\n"
+                    parts.append(f"   └── {city}: {city_data['files']} files, {city_size_mb:.1f} MB\n")
             
             # Add warnings and recommendations
             if total_size_gb > 5:
-                storage_info += "\n⚠️ **Storage Warning**: Consider archiving old recordings (>5GB used)"
+                parts.append("\n⚠️ **Storage Warning**: Consider archiving old recordings (>5GB used)")
             
             if file_count > 1000:
-                storage_info += "\n💡 **Tip**: Use the cleanup feature to manage old files"
+                parts.append("\n💡 **Tip**: Use the cleanup feature to manage old files")
             
-            storage_info += f"\n\n📂 **Folder Path Pattern**: recordings/Country/City/station_timestamp.mp3"
+            parts.append(f"\n\n📂 **Folder Path Pattern**: recordings/Country/City/station_timestamp.mp3")
             
-            return storage_info
+            report = ''.join(parts)
+            self._storage_info_cache = (cache_key, report)
+            return report
             
         except Exception as e:
             logger.error(f"Error getting storage info: {e}")
             return f"❌ Storage info error: {str(e)}"
 
+    def update_cities(self, country):
+        """Refresh the city and station dropdowns after a country change"""
+        # The city is reset, so the station list is the whole country's
+        cities = self.get_cities_by_country(country)
+        station_names = self.get_station_names(country)
+        return (gr.Dropdown(choices=cities, value=None),
+                gr.Dropdown(choices=station_names, value=None))
+    
+    def update_stations(self, country, city):
+        """Refresh the station dropdown for the selected city"""
+        station_names = self.get_station_names(country, city)
+        return gr.Dropdown(choices=station_names, value=None)
+    
+    def schedule_interval_wrapper(self, country, city, station, interval_min, duration):
+        """Schedule interval recording for the station picked in the UI"""
+        try:
+            selected_station = self.find_station(country, city, station)
+            
+            if not selected_station:
+                return f"❌ Station '{station}' not found"
+            
+            return self.schedule_interval_recording(
+                selected_station['name'],
+                selected_station['url'],
+                interval_min,
+                duration,
+                country,
+                city
+            )
+        except Exception as e:
+            return f"❌ Error: {str(e)}"
+    
+    def get_bulk_preview(self, country_filter, max_stations_limit):
+        """Preview how many stations will be affected"""
+        try:
+            if country_filter == "All Countries":
+                total_count = self._total_stations
+            else:
+                total_count = self._country_counts.get(country_filter, 0)
+            
+            limited_count = min(total_count, max_stations_limit) if max_stations_limit > 0 else total_count
+            
+            parts = [f"""
+📊 **Recording Preview:**
+
+🎯 **Scope:** {country_filter}
+📻 **Total Stations Available:** {total_count}
+📋 **Stations to Process:** {limited_count}
+"""]
+            
+            if country_filter == "All Countries":
+                parts.append(f"\n🌍 **Breakdown by Country:**")
+                for country, count in heapq.nlargest(10, self._country_counts.items(), key=lambda x: x[1]):
+                    parts.append(f"\n• {country}: {count} stations")
+                if len(self._country_counts) > 10:
+                    parts.append(f"\n• ... and {len(self._country_counts) - 10} more countries")
+            
+            return ''.join(parts)
+            
+        except Exception as e:
+            return f"❌ Error generating preview: {str(e)}"
+    
+    def schedule_all_wrapper(self, country_filter, interval_min, duration, max_stations):
+        """Schedule all stations from the bulk form (0 max stations = all)"""
+        max_stations_value = max_stations if max_stations > 0 else None
+        return self.schedule_all_stations_recording(
+            interval_min, duration, country_filter, max_stations_value
+        )
+    
+    def record_all_now_wrapper(self, country_filter, duration, max_concurrent, max_stations):
+        """Record all stations now from the bulk form (0 max stations = all)"""
+        max_stations_value = max_stations if max_stations > 0 else None
+        return self.record_all_stations_now(
+            duration, country_filter, max_concurrent, max_stations_value
+        )
+    
+    def refresh_detailed_stats(self):
+        """Reload statistics from the database and render the detailed report"""
+        self.load_statistics()
+        return self.get_detailed_statistics()
+    
+    def update_batch_cities(self, country):
+        """Refresh the batch city dropdown after a country change"""
+        cities = self.get_cities_by_country(country)
+        return gr.Dropdown(choices=cities, value=None)
+    
+    def batch_record_enhanced(self, country, city, duration, max_stations, max_concurrent=3):
+        """Enhanced batch recording with better control
+        
+        A generator, so Gradio streams each finished station to the
+        textbox before the final summary.
+        """
+        try:
+            stations = self.get_stations_by_location(country, city, limit=max_stations)
+            
+            if not stations:
+                yield f"❌ No stations found for {city or country}"
+                return
+            
+            total = len(stations)
+            results = []
+            successful = 0
+            
+            def record_station_wrapper(station):
+                return {
+                    'station_name': station['name'],
+                    'result': self.record_station(
+                        station['name'],
+                        station['url'],
+                        duration,
+                        country,
+                        city
+                    )
+                }
+            
+            # Keep at most max_concurrent of this request's recordings in the shared
+            # pool, submitting the next station as each one finishes
+            executor = self._batch_executor
+            waiting = iter(stations)
+            futures = {}
+            
+            def submit_next():
+                station = next(waiting, None)
+                if station is not None:
+                    future = executor.submit(record_station_wrapper, station)
+                    futures[future] = station['name']
+                    pending.add(future)
+            
+            pending = set()
+            for _ in range(max_concurrent):
+                submit_next()
+            
+            # Collect results as they finish; the deadline covers
+            # every wave of max_concurrent recordings
+            waves = -(-total // max_concurrent)
+            deadline = time.monotonic() + (duration + 60) * waves
+            while pending:
+                done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()),
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    for future in pending:
+                        future.cancel()
+                        results.append(f"❌ {futures[future]}: Timeout")
+                    for station in waiting:
+                        results.append(f"❌ {station['name']}: Timeout")
+                    break
+                
+                for future in done:
+                    station_name = futures[future]
+                    try:
+                        result = future.result()['result']
+                    except Exception as e:
+                        result = {'status': 'failed', 'error': str(e)}
+                    
+                    if result['status'] == 'success':
+                        results.append(f"✅ {station_name}: {result['filename']}")
+                        successful += 1
+                    else:
+                        results.append(f"❌ {station_name}: {result['error']}")
+                    
+                    submit_next()
+                    yield (f"⏳ Recorded {len(results)}/{total} stations...\n\n"
+                           + chr(10).join(results))
+            
+            # Every station ends up in results, so failures are the remainder
+            yield f"""
+📊 **Batch Recording Summary:**
+• Location: {city or country}
+• Total Stations: {total}
+• Successful: {successful}
+• Failed: {total - successful}
+• Success Rate: {(successful/total*100):.1f}%
+
+📋 **Detailed Results:**
+{chr(10).join(results)}
+"""
+            
+        except Exception as e:
+            logger.error(f"Error in batch recording: {e}")
+            yield f"❌ Batch recording error: {str(e)}"
+    
+    def cleanup_old_files(self, days):
+        """Delete recordings older than the given number of days"""
+        try:
+            recordings_dir = "recordings"
+            if not os.path.exists(recordings_dir):
+                return "No recordings directory found"
+            
+            # Plain epoch seconds, compared directly against each st_mtime
+            cutoff = time.time() - days * 86400
+            
+            deletable = [
+                (path, st.st_size)
+                for path, _, st in self._scan_recordings(recordings_dir)
+                if st.st_mtime < cutoff
+            ]
+            
+            # Overlap the unlink latency across a small pool; a file that can't be
+            # removed (e.g. still being recorded) is skipped rather than aborting
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                removed = list(executor.map(self._remove_recording,
+                                            (path for path, _ in deletable)))
+            deleted_count = sum(removed)
+            total_size = sum(size for (_, size), ok in zip(deletable, removed) if ok)
+            self._storage_info_cache = None
+            
+            total_size_mb = total_size / (1024 * 1024)
+            return f"🗑️ Deleted {deleted_count} files, freed {total_size_mb:.1f} MB"
+            
+        except Exception as e:
+            return f"❌ Cleanup error: {str(e)}"
+    
+    def get_filtered_stations_status(self, country_filter, status_filter, max_results_count,
+                                     compact=False, pages=1):
+        """Get filtered station status display
+        
+        Shows pages * max_results_count stations, one line each when compact;
+        "Load More" asks for the next page.
+        """
+        try:
+            stations_status = self.get_all_stations_status()
+            
+            if 'error' in stations_status:
+                return f"❌ Error loading stations: {stations_status['error']}"
+            
+            # The render only depends on the snapshot and the filter inputs
+            cache_key = (self._cached_status_time, country_filter, status_filter,
+                         int(max_results_count), compact, pages)
+            if self._filtered_status_cache and self._filtered_status_cache[0] == cache_key:
+                return self._filtered_status_cache[1]
+            
+            # Filter stations, materializing only the rows that are shown
+            # (plus one to tell whether another page exists)
+            limit = int(max_results_count) * pages
+            filtered_stations = list(islice(self.iter_stations_status(
+                country_filter if country_filter != "All Countries" else None,
+                status_filter if status_filter != "All Status" else None
+            ), limit + 1))
+            has_more = len(filtered_stations) > limit
+            del filtered_stations[limit:]
+            
+            # Build display; the summary header comes prebuilt with the snapshot
+            parts = [
+                self._summary_header,
+                f"🔍 **Filtered Results:** ({len(filtered_stations)} stations shown)\n\n"
+            ]
+            
+            # Group by country for better organization
+            stations_by_country = defaultdict(list)
+            for station in filtered_stations:
+                stations_by_country[station['country']].append(station)
+            
+            # Display stations grouped by country, in the prebuilt sorted country order
+            for country in self._countries_sorted:
+                country_stations = stations_by_country.get(country)
+                if not country_stations:
+                    continue
+                parts.append(_format_country_header(country, len(country_stations)))
+                
+                for station in country_stations:
+                    parts.append(_format_station_status(
+                        station['name'], station['city'], station['bitrate'],
+                        station['language'], station['status'], station['last_check'],
+                        compact
+                    ))
+            
+            if has_more:
+                parts.append("\n⬇️ More stations match these filters - click 'Load More' to show them")
+            
+            display = ''.join(parts)
+            self._filtered_status_cache = (cache_key, display)
+            return display
+            
+        except Exception as e:
+            logger.error(f"Error getting filtered stations status: {e}")
+            return f"❌ Error: {str(e)}"
+    
+    def apply_stations_filters(self, country_filter, status_filter, max_results_count, compact):
+        """Show the first page of the filtered station status display"""
+        return self.get_filtered_stations_status(country_filter, status_filter,
+                                                 max_results_count, compact), 1
+    
+    def load_more_stations_status(self, country_filter, status_filter, max_results_count,
+                                  compact, pages):
+        """Extend the filtered station status display by one page"""
+        pages += 1
+        return self.get_filtered_stations_status(country_filter, status_filter,
+                                                 max_results_count, compact, pages), pages
+    
     def create_interface(self):
         """Create the Gradio interface"""
         with gr.Blocks(title="Radio Recording Dashboard", theme=gr.themes.Soft()) as app:
@@ -1274,29 +1984,15 @@ class RadioDashboard:
                             
                             record_button = gr.Button("🎬 Start Recording", variant="primary")
                             
-                            def update_cities(country):
-                                cities = self.get_cities_by_country(country)
-                                return gr.Dropdown(choices=cities, value=None)
-                            
-                            def update_stations(country, city):
-                                stations = self.get_stations_by_location(country, city)
-                                station_names = [s['name'] for s in stations[:20]]  # Limit to 20
-                                return gr.Dropdown(choices=station_names, value=None)
-                            
                             country_dropdown.change(
-                                fn=update_cities,
+                                fn=self.update_cities,
                                 inputs=[country_dropdown],
-                                outputs=[city_dropdown]
+                                outputs=[city_dropdown, station_dropdown]
                             )
                             
-                            country_dropdown.change(
-                                fn=update_stations,
-                                inputs=[country_dropdown, city_dropdown],
-                                outputs=[station_dropdown]
-                            )
-                            
-                            city_dropdown.change(
-                                fn=update_stations,
+                            # User selections only; update_cities already refreshed the stations
+                            city_dropdown.input(
+                                fn=self.update_stations,
                                 inputs=[country_dropdown, city_dropdown],
                                 outputs=[station_dropdown]
                             )
@@ -1354,29 +2050,16 @@ class RadioDashboard:
                                     
                                     interval_button = gr.Button("🔄 Start Interval Recording", variant="primary")
                                     
-                                    def update_interval_cities(country):
-                                        cities = self.get_cities_by_country(country)
-                                        return gr.Dropdown(choices=cities, value=None)
-                                    
-                                    def update_interval_stations(country, city):
-                                        stations = self.get_stations_by_location(country, city)
-                                        station_names = [s['name'] for s in stations[:20]]
-                                        return gr.Dropdown(choices=station_names, value=None)
-                                    
                                     interval_country.change(
-                                        fn=update_interval_cities,
+                                        fn=self.update_cities,
                                         inputs=[interval_country],
-                                        outputs=[interval_city]
+                                        outputs=[interval_city, interval_station]
                                     )
                                     
-                                    interval_country.change(
-                                        fn=update_interval_stations,
-                                        inputs=[interval_country, interval_city],
-                                        outputs=[interval_station]
-                                    )
-                                    
-                                    interval_city.change(
-                                        fn=update_interval_stations,
+                                    # .input fires only on user selection, so the city reset made by
+                                    # update_cities does not chain a second station refresh
+                                    interval_city.input(
+                                        fn=self.update_stations,
                                         inputs=[interval_country, interval_city],
                                         outputs=[interval_station]
                                     )
@@ -1388,31 +2071,8 @@ class RadioDashboard:
                                         interactive=False
                                     )
                                     
-                                    def schedule_interval_wrapper(country, city, station, interval_min, duration):
-                                        try:
-                                            stations = self.get_stations_by_location(country, city)
-                                            selected_station = None
-                                            for s in stations:
-                                                if s['name'] == station:
-                                                    selected_station = s
-                                                    break
-                                            
-                                            if not selected_station:
-                                                return f"❌ Station '{station}' not found"
-                                            
-                                            return self.schedule_interval_recording(
-                                                selected_station['name'],
-                                                selected_station['url'],
-                                                interval_min,
-                                                duration,
-                                                country,
-                                                city
-                                            )
-                                        except Exception as e:
-                                            return f"❌ Error: {str(e)}"
-                                    
                                     interval_button.click(
-                                        fn=schedule_interval_wrapper,
+                                        fn=self.schedule_interval_wrapper,
                                         inputs=[interval_country, interval_city, interval_station, interval_minutes, interval_duration],
                                         outputs=[interval_output]
                                     )
@@ -1425,7 +2085,7 @@ class RadioDashboard:
                                     gr.Markdown("⚠️ **Warning**: This will record ALL radio stations. Use with caution!")
                                     
                                     bulk_country_filter = gr.Dropdown(
-                                        choices=["All Countries"] + self.get_countries(),
+                                        choices=self._countries_with_all,
                                         value="All Countries",
                                         label="Country Filter"
                                     )
@@ -1462,7 +2122,7 @@ class RadioDashboard:
                                     
                                     instant_max_concurrent = gr.Slider(
                                         minimum=1,
-                                        maximum=10,
+                                        maximum=50,
                                         value=3,
                                         step=1,
                                         label="Max Concurrent Recordings"
@@ -1484,104 +2144,45 @@ class RadioDashboard:
                                         placeholder="Configure settings and click 'Schedule All Stations' or 'Record All Now'..."
                                     )
                                     
-                                    def get_bulk_preview(country_filter, max_stations_limit):
-                                        """Preview how many stations will be affected"""
-                                        try:
-                                            total_count = 0
-                                            country_breakdown = {}
-                                            
-                                            if country_filter == "All Countries":
-                                                for country, stations in self.stations_by_country.items():
-                                                    count = len(stations)
-                                                    total_count += count
-                                                    country_breakdown[country] = count
-                                            else:
-                                                stations = self.stations_by_country.get(country_filter, [])
-                                                total_count = len(stations)
-                                                country_breakdown[country_filter] = total_count
-                                            
-                                            limited_count = min(total_count, max_stations_limit) if max_stations_limit > 0 else total_count
-                                            
-                                            preview = f"""
-📊 **Recording Preview:**
-
-🎯 **Scope:** {country_filter}
-📻 **Total Stations Available:** {total_count}
-📋 **Stations to Process:** {limited_count}
-"""
-                                            
-                                            if country_filter == "All Countries":
-                                                preview += f"\n🌍 **Breakdown by Country:**"
-                                                for country, count in sorted(country_breakdown.items(), key=lambda x: x[1], reverse=True)[:10]:
-                                                    preview += f"\n• {country}: {count} stations"
-                                                if len(country_breakdown) > 10:
-                                                    preview += f"\n• ... and {len(country_breakdown) - 10} more countries"
-                                            
-                                            return preview
-                                            
-                                        except Exception as e:
-                                            return f"❌ Error generating preview: {str(e)}"
-                                    
-                                    # Preview updates
-                                    def update_preview():
-                                        return get_bulk_preview(bulk_country_filter.value, bulk_max_stations.value)
-                                    
-                                    bulk_country_filter.change(
-                                        fn=lambda country, max_stations: get_bulk_preview(country, max_stations),
-                                        inputs=[bulk_country_filter, bulk_max_stations],
-                                        outputs=[bulk_output]
-                                    )
-                                    
-                                    bulk_max_stations.change(
-                                        fn=lambda country, max_stations: get_bulk_preview(country, max_stations),
+                                    # Preview updates: one listener for both inputs, so always_last
+                                    # collapses a burst of slider and filter changes into the final value
+                                    gr.on(
+                                        triggers=[bulk_country_filter.change, bulk_max_stations.change],
+                                        fn=self.get_bulk_preview,
                                         inputs=[bulk_country_filter, bulk_max_stations],
-                                        outputs=[bulk_output]
+                                        outputs=[bulk_output],
+                                        trigger_mode="always_last",
+                                        show_progress="hidden"
                                     )
                                     
                                     # Button actions
-                                    def schedule_all_wrapper(country_filter, interval_min, duration, max_stations):
-                                        max_stations_value = max_stations if max_stations > 0 else None
-                                        return self.schedule_all_stations_recording(
-                                            interval_min, duration, country_filter, max_stations_value
-                                        )
-                                    
-                                    def record_all_now_wrapper(country_filter, duration, max_concurrent, max_stations):
-                                        max_stations_value = max_stations if max_stations > 0 else None
-                                        return self.record_all_stations_now(
-                                            duration, country_filter, max_concurrent, max_stations_value
-                                        )
-                                    
                                     bulk_schedule_button.click(
-                                        fn=schedule_all_wrapper,
+                                        fn=self.schedule_all_wrapper,
                                         inputs=[bulk_country_filter, bulk_interval_minutes, bulk_duration, bulk_max_stations],
                                         outputs=[bulk_output]
                                     )
                                     
                                     bulk_record_now_button.click(
-                                        fn=record_all_now_wrapper,
+                                        fn=self.record_all_now_wrapper,
                                         inputs=[bulk_country_filter, bulk_duration, instant_max_concurrent, instant_max_stations],
                                         outputs=[bulk_output]
                                     )
                 
                 # Tab 3: Detailed Statistics & Monitoring
-                with gr.Tab("📊 Detailed Statistics"):
+                with gr.Tab("📊 Detailed Statistics") as stats_tab:
                     with gr.Row():
                         with gr.Column():
                             detailed_stats_display = gr.Textbox(
                                 label="Comprehensive Statistics",
                                 lines=20,
                                 interactive=False,
-                                value=self.get_detailed_statistics()
+                                placeholder="Loading..."
                             )
                             
                             refresh_detailed_stats_button = gr.Button("🔄 Refresh Detailed Statistics")
                             
-                            def refresh_detailed_stats():
-                                self.load_statistics()
-                                return self.get_detailed_statistics()
-                            
                             refresh_detailed_stats_button.click(
-                                fn=refresh_detailed_stats,
+                                fn=self.refresh_detailed_stats,
                                 outputs=[detailed_stats_display]
                             )
                         
@@ -1590,7 +2191,7 @@ class RadioDashboard:
                                 label="Recent Recordings",
                                 lines=20,
                                 interactive=False,
-                                value=self.get_recent_recordings()
+                                placeholder="Loading..."
                             )
                             
                             refresh_recordings_button = gr.Button("🔄 Refresh Recent Recordings")
@@ -1632,12 +2233,8 @@ class RadioDashboard:
                             
                             batch_record_button = gr.Button("📦 Start Batch Recording", variant="primary")
                             
-                            def update_batch_cities(country):
-                                cities = self.get_cities_by_country(country)
-                                return gr.Dropdown(choices=cities, value=None)
-                            
                             batch_country.change(
-                                fn=update_batch_cities,
+                                fn=self.update_batch_cities,
                                 inputs=[batch_country],
                                 outputs=[batch_city]
                             )
@@ -1649,88 +2246,21 @@ class RadioDashboard:
                                 interactive=False
                             )
                             
-                            def batch_record_enhanced(country, city, duration, max_stations, max_concurrent):
-                                """Enhanced batch recording with better control"""
-                                try:
-                                    stations = self.get_stations_by_location(country, city)
-                                    
-                                    if not stations:
-                                        return f"❌ No stations found for {city or country}"
-                                    
-                                    # Limit number of stations
-                                    stations = stations[:max_stations]
-                                    results = []
-                                    successful = 0
-                                    failed = 0
-                                    
-                                    def record_station_wrapper(station):
-                                        return {
-                                            'station_name': station['name'],
-                                            'result': self.record_station(
-                                                station['name'],
-                                                station['url'],
-                                                duration,
-                                                country,
-                                                city
-                                            )
-                                        }
-                                    
-                                    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-                                        # Submit recording jobs
-                                        futures = []
-                                        for station in stations:
-                                            future = executor.submit(record_station_wrapper, station)
-                                            futures.append(future)
-                                        
-                                        # Collect results
-                                        for future in futures:
-                                            try:
-                                                result_data = future.result(timeout=duration + 60)
-                                                station_name = result_data['station_name']
-                                                result = result_data['result']
-                                                
-                                                if result['status'] == 'success':
-                                                    results.append(f"✅ {station_name}: {result['filename']}")
-                                                    successful += 1
-                                                else:
-                                                    results.append(f"❌ {station_name}: {result['error']}")
-                                                    failed += 1
-                                            except Exception as e:
-                                                results.append(f"❌ Unknown station: Timeout or error")
-                                                failed += 1
-                                    
-                                    summary = f"""
-📊 **Batch Recording Summary:**
-• Location: {city or country}
-• Total Stations: {len(stations)}
-• Successful: {successful}
-• Failed: {failed}
-• Success Rate: {(successful/len(stations)*100):.1f}%
-
-📋 **Detailed Results:**
-{chr(10).join(results)}
-"""
-                                    return summary
-                                    
-                                except Exception as e:
-                                    logger.error(f"Error in batch recording: {e}")
-                                    return f"❌ Batch recording error: {str(e)}"
-                            
                             batch_record_button.click(
-                                fn=batch_record_enhanced,
+                                fn=self.batch_record_enhanced,
                                 inputs=[batch_country, batch_city, batch_duration, batch_max_stations],
                                 outputs=[batch_output]
                             )
                 
                 # Tab 5: Scheduled Recordings Management
-                with gr.Tab("⏰ Schedule Management"):
+                with gr.Tab("⏰ Schedule Management") as schedule_tab:
                     with gr.Row():
                         with gr.Column():
                             scheduled_display = gr.Textbox(
                                 label="Active Scheduled Recordings",
                                 lines=15,
                                 interactive=False,
-                                value=self.get_scheduled_recordings()
+                                placeholder="Loading..."
                             )
                             
                             refresh_scheduled_button = gr.Button("🔄 Refresh Scheduled")
@@ -1768,14 +2298,14 @@ class RadioDashboard:
                             )
                 
                 # Tab 6: Storage & Export
-                with gr.Tab("💾 Storage & Export"):
+                with gr.Tab("💾 Storage & Export") as storage_tab:
                     with gr.Row():
                         with gr.Column():
                             storage_display = gr.Textbox(
                                 label="Storage Information",
                                 lines=10,
                                 interactive=False,
-                                value=self.get_storage_info()
+                                placeholder="Loading..."
                             )
                             
                             refresh_storage_button = gr.Button("🔄 Refresh Storage Info")
@@ -1814,34 +2344,6 @@ class RadioDashboard:
                             
                             cleanup_button = gr.Button("🗑️ Cleanup Old Files", variant="secondary")
                             
-                            def cleanup_old_files(days):
-                                try:
-                                    recordings_dir = "recordings"
-                                    if not os.path.exists(recordings_dir):
-                                        return "No recordings directory found"
-                                    
-                                    cutoff_date = datetime.now() - timedelta(days=days)
-                                    deleted_count = 0
-                                    total_size = 0
-                                    
-                                    for root, dirs, files in os.walk(recordings_dir):
-                                        for file in files:
-                                            if file.endswith('.mp3'):
-                                                file_path = os.path.join(root, file)
-                                                file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                                                
-                                                if file_time < cutoff_date:
-                                                    file_size = os.path.getsize(file_path)
-                                                    os.remove(file_path)
-                                                    deleted_count += 1
-                                                    total_size += file_size
-                                    
-                                    total_size_mb = total_size / (1024 * 1024)
-                                    return f"🗑️ Deleted {deleted_count} files, freed {total_size_mb:.1f} MB"
-                                    
-                                except Exception as e:
-                                    return f"❌ Cleanup error: {str(e)}"
-                            
                             cleanup_output = gr.Textbox(
                                 label="Cleanup Status",
                                 lines=3,
@@ -1849,7 +2351,7 @@ class RadioDashboard:
                             )
                             
                             cleanup_button.click(
-                                fn=cleanup_old_files,
+                                fn=self.cleanup_old_files,
                                 inputs=[cleanup_days],
                                 outputs=[cleanup_output]
                             )
@@ -1864,7 +2366,7 @@ class RadioDashboard:
                             
                             gr.Markdown("### Quick Filters")
                             filter_country = gr.Dropdown(
-                                choices=["All Countries"] + self.get_countries(),
+                                choices=self._countries_with_all,
                                 value="All Countries",
                                 label="Filter by Country"
                             )
@@ -1883,7 +2385,15 @@ class RadioDashboard:
                                 label="Max Results to Show"
                             )
                             
+                            compact_view = gr.Checkbox(
+                                value=True,
+                                label="Compact view (one line per station)"
+                            )
+                            
                             apply_filters_button = gr.Button("🔍 Apply Filters")
+                            load_more_button = gr.Button("⬇️ Load More")
+                            # Pages of max_results currently shown by the status display
+                            status_pages = gr.State(1)
                         
                         with gr.Column(scale=3):
                             all_stations_display = gr.Textbox(
@@ -1893,76 +2403,6 @@ class RadioDashboard:
                                 placeholder="Click 'Test All Stations' to check connection status for all radio stations..."
                             )
                     
-                    def get_filtered_stations_status(country_filter, status_filter, max_results_count):
-                        """Get filtered station status display"""
-                        try:
-                            stations_status = self.get_all_stations_status()
-                            
-                            if 'error' in stations_status:
-                                return f"❌ Error loading stations: {stations_status['error']}"
-                            
-                            # Filter stations
-                            filtered_stations = []
-                            for station in stations_status['detailed_status']:
-                                # Apply country filter
-                                if country_filter != "All Countries" and station['country'] != country_filter:
-                                    continue
-                                
-                                # Apply status filter
-                                if status_filter != "All Status":
-                                    if status_filter.lower() != station['status'].lower():
-                                        continue
-                                
-                                filtered_stations.append(station)
-                            
-                            # Limit results
-                            filtered_stations = filtered_stations[:max_results_count]
-                            
-                            # Build display
-                            display = f"""
-🌐 **Complete Radio Stations Status**
-
-📊 **Summary:**
-• Total Stations: {stations_status['total_stations']}
-• Online: {stations_status['online_stations']} ({(stations_status['online_stations']/stations_status['total_stations']*100) if stations_status['total_stations'] > 0 else 0:.1f}%)
-• Offline: {stations_status['offline_stations']} ({(stations_status['offline_stations']/stations_status['total_stations']*100) if stations_status['total_stations'] > 0 else 0:.1f}%)
-• Untested: {stations_status['untested_stations']} ({(stations_status['untested_stations']/stations_status['total_stations']*100) if stations_status['total_stations'] > 0 else 0:.1f}%)
-
-🔍 **Filtered Results:** ({len(filtered_stations)} stations shown)
-
-"""
-                            
-                            # Group by country for better organization
-                            stations_by_country = {}
-                            for station in filtered_stations:
-                                country = station['country']
-                                if country not in stations_by_country:
-                                    stations_by_country[country] = []
-                                stations_by_country[country].append(station)
-                            
-                            # Display stations grouped by country
-                            for country, country_stations in sorted(stations_by_country.items()):
-                                display += f"\n🇾🇪 **{country}** ({len(country_stations)} stations):\n"
-                                
-                                for station in country_stations:
-                                    status_icon = {
-                                        'online': '🟢',
-                                        'offline': '🔴',
-                                        'untested': '⚪'
-                                    }.get(station['status'], '❓')
-                                    
-                                    display += f"{status_icon} {station['name']}\n"
-                                    display += f"   📍 {station['city']}\n"
-                                    display += f"   🎵 {station['bitrate']} kbps, 🗣️ {station['language']}\n"
-                                    display += f"   🔗 Status: {station['status'].title()}\n"
-                                    display += f"   🕐 Last Check: {station['last_check']}\n\n"
-                            
-                            return display
-                            
-                        except Exception as e:
-                            logger.error(f"Error getting filtered stations status: {e}")
-                            return f"❌ Error: {str(e)}"
-                    
                     # Button actions
                     test_all_button.click(
                         fn=self.test_all_stations_connection,
@@ -1970,22 +2410,55 @@ class RadioDashboard:
                     )
                     
                     apply_filters_button.click(
-                        fn=get_filtered_stations_status,
-                        inputs=[filter_country, filter_status, max_results],
-                        outputs=[all_stations_display]
+                        fn=self.apply_stations_filters,
+                        inputs=[filter_country, filter_status, max_results, compact_view],
+                        outputs=[all_stations_display, status_pages]
+                    )
+                    # Changed filters start paging over, whether or not Apply is clicked
+                    gr.on(
+                        triggers=[filter_country.change, filter_status.change,
+                                  max_results.change, compact_view.change],
+                        fn=lambda: 1,
+                        outputs=[status_pages],
+                        queue=False
+                    )
+                    
+                    load_more_button.click(
+                        fn=self.load_more_stations_status,
+                        inputs=[filter_country, filter_status, max_results, compact_view, status_pages],
+                        outputs=[all_stations_display, status_pages]
                     )
             
             gr.Markdown("---")
             gr.Markdown("### 📁 Recordings Structure: `recordings/Country/City/station_timestamp.mp3`")
             gr.Markdown("### 🔄 Interval Recording: Automatic recording every X minutes/hours")
             gr.Markdown("### 🗄️ All data stored in `radio_recordings.db`")
+            
+            # Fill each report panel when its tab is opened rather than while building
+            # the Blocks or on page load, so only the reports a visitor looks at run
+            stats_tab.select(fn=self.get_detailed_statistics, outputs=[detailed_stats_display])
+            stats_tab.select(fn=self.get_recent_recordings, outputs=[recent_recordings])
+            schedule_tab.select(fn=self.get_scheduled_recordings, outputs=[scheduled_display])
+            storage_tab.select(fn=self.get_storage_info, outputs=[storage_display])
         
         return app
     
     def cleanup(self):
         """Cleanup resources"""
         self.is_running = False
+        self._sched_event.set()
+        if self.scheduler_thread is not None and self.scheduler_thread.is_alive():
+            # Give a running job up to 2s to finish before its schedule is dropped;
+            # a longer recording job is cut off when the process exits
+            self.scheduler_thread.join(timeout=2)
         schedule.clear()
+        if self._db_writer_thread is not None and self._db_writer_thread.is_alive():
+            # Flush pending writes before the writer's connection is closed
+            self._write_queue.put(None)
+            self._db_writer_thread.join(timeout=5)
+        self._batch_executor.shutdown(wait=False, cancel_futures=True)
+        self.close_connections()
+        self._http.close()
 
 def signal_handler(signum, frame):
     """Handle shutdown signals"""